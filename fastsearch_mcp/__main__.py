@@ -1,4 +1,4 @@
-""
+"""
 FastSearch MCP - Command Line Interface
 
 This module provides the entry point for the DXT package.
@@ -13,17 +13,17 @@ from typing import Any, Dict, Optional
 from .mcp_server import McpServer
 from .decorators import generate_markdown_docs
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stderr
-)
-
 logger = logging.getLogger(__name__)
 
 async def run_server() -> None:
     """Run the MCP server."""
+    # Only the server logs; the docs and help commands skip logging setup
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        stream=sys.stderr
+    )
+    
     server = McpServer()
     await server.start()
 
@@ -6,12 +6,11 @@ These decorators serve a dual purpose:
 2. Generate markdown documentation automatically
 """
 
-import inspect
+import io
 import json
 from dataclasses import dataclass, field
-from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from pydantic import BaseModel, create_model
 
@@ -28,71 +27,65 @@ class MCPMethodDoc:
     examples: List[Dict[str, Any]] = field(default_factory=list)
     source_file: str = ""
     source_line: int = 0
+    _markdown: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def to_markdown(self) -> str:
-        """Convert documentation to markdown format."""
-        lines = [
-            f"## `{self.name}`",
-            "",
-            self.description,
-            "",
-            "### Parameters",
-            ""
-        ]
+        """Convert documentation to markdown format.
+        
+        The rendered markdown is cached, so repeated calls (docstring
+        assignment and docs generation) only render once.
+        """
+        if self._markdown is None:
+            self._markdown = self._render_markdown()
+        return self._markdown
+    
+    def _render_markdown(self) -> str:
+        """Render the documentation as markdown."""
+        buf = io.StringIO()
+        w = buf.write
+        
+        w(f"## `{self.name}`\n\n")
+        w(self.description)
+        w("\n\n### Parameters\n\n")
         
         # Add parameters
         if not self.params:
-            lines.append("*No parameters*")
+            w("*No parameters*\n")
         else:
-            lines.append("| Name | Type | Required | Default | Description |")
-            lines.append("|------|------|----------|---------|-------------|")
+            w("| Name | Type | Required | Default | Description |\n")
+            w("|------|------|----------|---------|-------------|\n")
             for name, param in self.params.items():
                 param_type = param.get('type', 'any')
                 if 'enum' in param:
                     param_type = f"{'&#124;'.join(param['enum'])}"
                 required = "**Yes**" if param.get('required', False) else "No"
                 default = f"`{param['default']}`" if 'default' in param else ""
-                lines.append(
+                w(
                     f"| `{name}` | {param_type} | {required} | {default} | "
-                    f"{param.get('description', '')} |"
+                    f"{param.get('description', '')} |\n"
                 )
         
         # Add return value
-        lines.extend([
-            "",
-            "### Returns",
-            "",
-            f"```json\n{json.dumps(self.returns, indent=2)}\n```",
-            ""
-        ])
+        w("\n### Returns\n\n```json\n")
+        w(json.dumps(self.returns, indent=2))
+        w("\n```\n\n")
         
         # Add examples
         if self.examples:
-            lines.extend(["### Examples", ""])
+            w("### Examples\n\n")
             for i, example in enumerate(self.examples, 1):
-                lines.extend([
-                    f"#### Example {i}",
-                    "",
-                    "**Request:**",
-                    "```json",
-                    json.dumps({"method": self.name, "params": example["request"]}, indent=2),
-                    "```",
-                    "",
-                    "**Response:**",
-                    "```json",
-                    json.dumps({"result": example["response"]}, indent=2),
-                    "```",
-                    ""
-                ])
+                w(f"#### Example {i}\n\n**Request:**\n```json\n")
+                w(json.dumps({"method": self.name, "params": example["request"]}, indent=2))
+                w("\n```\n\n**Response:**\n```json\n")
+                w(json.dumps({"result": example["response"]}, indent=2))
+                w("\n```\n\n")
         
         # Add source location
         if self.source_file and self.source_line:
-            lines.extend([
-                "---",
-                f"*Defined in `{self.source_file}`, line {self.source_line}*"
-            ])
+            w(f"---\n*Defined in `{self.source_file}`, line {self.source_line}*\n")
         
-        return "\n".join(lines)
+        # Every line above is newline-terminated; drop the final terminator
+        return buf.getvalue()[:-1]
 
 def mcp_method(
     name: str,
@@ -112,19 +105,11 @@ def mcp_method(
         examples: List of example request/response pairs
     """
     def decorator(func: F) -> F:
-        # Get source file and line for documentation
-        frame = inspect.currentframe()
-        try:
-            # Go up two frames to get to the actual function definition
-            if frame and frame.f_back and frame.f_back.f_back:
-                frame_info = inspect.getframeinfo(frame.f_back.f_back)
-                source_file = frame_info.filename
-                source_line = frame_info.lineno
-            else:
-                source_file = ""
-                source_line = 0
-        finally:
-            del frame  # Avoid reference cycles
+        # Get source file and line for documentation from the code object,
+        # which avoids walking frames and reading the source file
+        code = getattr(func, "__code__", None)
+        source_file = code.co_filename if code else ""
+        source_line = code.co_firstlineno if code else 0
         
         # Create documentation object
         doc = MCPMethodDoc(
@@ -138,22 +123,13 @@ def mcp_method(
         )
         
         # Store documentation in the function
-        if not hasattr(func, "__mcp_docs__"):
-            func.__mcp_docs__ = []
-        func.__mcp_docs__.append(doc)
+        func.__mcp_doc__ = doc
         
         # Add documentation to the function's docstring
         func.__doc__ = doc.to_markdown()
         
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            return await func(*args, **kwargs)
-            
-        # Copy the documentation to the wrapper
-        wrapper.__mcp_docs__ = getattr(func, "__mcp_docs__", [])
-        wrapper.__doc__ = func.__doc__
-        
-        return cast(F, wrapper)
+        # Return the function itself so calls don't pay for an extra coroutine frame
+        return func
     
     return decorator
 
@@ -167,33 +143,29 @@ def generate_markdown_docs(module, output_file: str) -> None:
     """
     docs = []
     
-    # Find all functions with MCP documentation
-    for name, obj in inspect.getmembers(module):
-        if inspect.isfunction(obj) and hasattr(obj, "__mcp_docs__"):
-            for doc in obj.__mcp_docs__:
+    # Find all functions with MCP documentation, including methods defined on
+    # classes in the module (e.g. McpServer handlers)
+    for obj in module.__dict__.values():
+        members = obj.__dict__.values() if isinstance(obj, type) else (obj,)
+        for member in members:
+            if (doc := getattr(member, "__mcp_doc__", None)) is not None:
                 docs.append((doc.name, doc))
     
     # Sort by method name
     docs.sort(key=lambda x: x[0])
     
-    # Generate markdown
-    lines = [
-        "# FastSearch MCP API Documentation",
-        "",
-        "## Table of Contents",
-        ""
-    ]
-    
-    # Add table of contents
-    for name, doc in docs:
-        lines.append(f"- [`{name}`](#{name.replace('.', '').lower()})")
-    
-    # Add method documentation
-    for name, doc in docs:
-        lines.extend(["", "", doc.to_markdown()])
-    
-    # Write to file
+    # Stream the markdown straight to the file; each method's markdown is
+    # already rendered (and cached) on its MCPMethodDoc
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines))
+        f.write("# FastSearch MCP API Documentation\n\n## Table of Contents\n")
+        
+        # Add table of contents
+        for name, doc in docs:
+            f.write(f"\n- [`{name}`](#{name.replace('.', '').lower()})")
+        
+        # Add method documentation
+        for name, doc in docs:
+            f.write("\n\n\n")
+            f.write(doc.to_markdown())
     
     print(f"Documentation generated: {output_file}")
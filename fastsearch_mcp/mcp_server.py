@@ -13,6 +13,10 @@ from .pipe_client import PipeClient, PipeClientError
 
 logger = logging.getLogger(__name__)
 
+# Keys of a fastsearch.search result; service responses of exactly this shape
+# are passed through without being copied
+_SEARCH_RESULT_KEYS = frozenset(("results", "total", "stats"))
+
 class McpServer:
     """MCP server with decorator-based documentation."""
     
@@ -140,6 +144,8 @@ class McpServer:
         try:
             # Forward the search request to the Windows service
             result = await self.pipe_client.send_request("search", params)
+            if result.keys() == _SEARCH_RESULT_KEYS:
+                return result
             return {
                 "results": result.get("results", []),
                 "total": result.get("total", 0),
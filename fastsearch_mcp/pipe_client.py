@@ -2,19 +2,48 @@
 
 import os
 import json
+import itertools
 import logging
 import asyncio
 import win32pipe, win32file, pywintypes
 from typing import Any, Dict, Optional, Union
 
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Read size for pipe responses; matches the service's pipe buffer size
+READ_CHUNK_SIZE = 65536
+
+# Maximum size of a single response line on the overlapped (stream) path
+MAX_RESPONSE_SIZE = 64 * 1024 * 1024
+
+# Seconds to wait for the response to a request
+REQUEST_TIMEOUT = 60.0
+
 class PipeClientError(Exception):
     """Base exception for pipe client errors."""
     pass
 
 class PipeClient:
-    """Client for communicating with the FastSearch Windows service via named pipes."""
+    """Client for communicating with the FastSearch Windows service via named pipes.
+    
+    On a ``ProactorEventLoop`` (the default on Windows) the pipe is opened for
+    overlapped I/O and reads/writes complete on the loop's I/O completion port.
+    Other event loops fall back to blocking pywin32 calls in the default executor.
+    """
+    
+    # Newline-terminated JSON-RPC request frame: id, encoded method, encoded params
+    _REQUEST_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":%s,"params":%s}\n'
     
     def __init__(self, pipe_name: str = r"\\.\pipe\fastsearch-service"):
         """Initialize the pipe client.
@@ -24,7 +53,23 @@ class PipeClient:
         """
         self.pipe_name = pipe_name
         self.handle = None
-        self._lock = asyncio.Lock()
+        # Overlapped I/O streams, set when connected through the proactor
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connect_lock = asyncio.Lock()
+        # Guards writes so concurrent requests don't interleave on the pipe
+        self._write_lock = asyncio.Lock()
+        # Requests awaiting a response, keyed by JSON-RPC id
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._request_ids = itertools.count(1)
+        # Number of requests written to the pipe that have not been answered yet
+        self._in_flight = 0
+        self._reader_task: Optional[asyncio.Task] = None
+    
+    @property
+    def connected(self) -> bool:
+        """Whether the client currently holds an open pipe connection."""
+        return self.handle is not None or self._writer is not None
     
     async def connect(self, timeout: float = 5.0) -> bool:
         """Connect to the named pipe.
@@ -35,21 +80,45 @@ class PipeClient:
         Returns:
             bool: True if connected successfully, False otherwise.
         """
-        if self.handle is not None:
+        if self.connected:
             return True
             
-        try:
-            # Use asyncio to run the blocking operation in a thread
+        # Concurrent first requests must share a single connection
+        async with self._connect_lock:
+            if self.connected:
+                return True
+            
             loop = asyncio.get_running_loop()
-            self.handle = await loop.run_in_executor(
-                None,
-                self._connect_blocking
+            try:
+                if hasattr(loop, "create_pipe_connection"):
+                    await asyncio.wait_for(self._connect_overlapped(loop), timeout)
+                else:
+                    # Use asyncio to run the blocking operation in a thread
+                    self.handle = await loop.run_in_executor(
+                        None,
+                        self._connect_blocking
+                    )
+                return True
+            except Exception as e:
+                logger.error(f"Failed to connect to pipe: {e}")
+                self._mark_disconnected()
+                return False
+    
+    async def _connect_overlapped(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Open the pipe for overlapped I/O on the proactor event loop."""
+        reader = asyncio.StreamReader(limit=MAX_RESPONSE_SIZE)
+        try:
+            transport, protocol = await loop.create_pipe_connection(
+                lambda: asyncio.StreamReaderProtocol(reader),
+                self.pipe_name
             )
-            return True
-        except Exception as e:
-            logger.error(f"Failed to connect to pipe: {e}")
-            self.handle = None
-            return False
+        except FileNotFoundError as e:
+            raise PipeClientError("FastSearch service is not running") from e
+        except OSError as e:
+            raise PipeClientError(f"Failed to connect to pipe: {e}") from e
+        
+        self._reader = reader
+        self._writer = asyncio.StreamWriter(transport, protocol, reader, loop)
     
     def _connect_blocking(self) -> int:
         """Blocking implementation of pipe connection."""
@@ -70,8 +139,31 @@ class PipeClient:
                 raise PipeClientError("FastSearch service is not running") from e
             raise PipeClientError(f"Failed to connect to pipe: {e}") from e
     
+    def _mark_disconnected(self) -> None:
+        """Drop the connection state without waiting on the pipe."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+        self.handle = None
+    
     async def close(self) -> None:
         """Close the pipe connection."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        self._fail_pending(PipeClientError("Pipe connection closed"))
+        
+        if self._writer is not None:
+            writer = self._writer
+            self._reader = None
+            self._writer = None
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception as e:
+                logger.error(f"Error closing pipe: {e}")
+        
         if self.handle is not None:
             try:
                 # Use asyncio to run the blocking operation in a thread
@@ -86,12 +178,18 @@ class PipeClient:
             finally:
                 self.handle = None
     
-    async def send_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def send_request(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = REQUEST_TIMEOUT
+    ) -> Dict[str, Any]:
         """Send a request to the service and get the response.
         
         Args:
             method: The method to call on the service.
             params: Optional parameters for the method.
+            timeout: Seconds to wait for the response (None to wait forever).
             
         Returns:
             Dict[str, Any]: The response from the service.
@@ -99,53 +197,127 @@ class PipeClient:
         Raises:
             PipeClientError: If there's an error communicating with the service.
         """
-        if self.handle is None:
+        if not self.connected:
             if not await self.connect():
                 raise PipeClientError("Not connected to pipe")
         
-        # Create the request
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params or {},
-            "id": 1
-        }
+        loop = asyncio.get_running_loop()
+        request_id = next(self._request_ids)
         
-        # Serialize the request to JSON
-        request_data = json.dumps(request).encode('utf-8')
+        # Only the method and params need encoding; the envelope is constant
+        request_data = self._REQUEST_TEMPLATE % (
+            request_id,
+            _json_dumps(method),
+            _json_dumps(params or {})
+        )
         
-        # Add a newline terminator
-        request_data = request_data + b"\n"
+        # Register before writing so the reader can never see a response
+        # for an id it doesn't know about
+        future = loop.create_future()
+        self._pending[request_id] = future
+        # Counted before the write, so a reader already running can't see
+        # the response while the count doesn't include it yet
+        self._in_flight += 1
         
-        async with self._lock:
-            try:
-                # Send the request
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(
-                    None,
-                    lambda: win32file.WriteFile(self.handle, request_data)
-                )
-                
-                # Read the response
-                response_data = await loop.run_in_executor(
-                    None,
-                    self._read_response_blocking
-                )
+        try:
+            async with self._write_lock:
+                await self._write(loop, request_data)
+        except (pywintypes.error, OSError) as e:
+            self._pending.pop(request_id, None)
+            self._in_flight = max(0, self._in_flight - 1)
+            self._mark_disconnected()
+            raise PipeClientError(f"Pipe communication error: {e}") from e
+        
+        # Only read while there are unanswered requests: a blocking read on
+        # an idle pipe would hold the handle and stall the next write
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = loop.create_task(self._read_responses())
+        
+        try:
+            response = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            # A late response would be matched to the wrong request, so the
+            # connection can't be reused
+            error = PipeClientError(f"No response to {method!r} after {timeout} seconds")
+            self._reset(error)
+            raise error from None
+        if "error" in response:
+            raise PipeClientError(f"Service error: {response['error']}")
+        return response.get("result", {})
+    
+    async def _write(self, loop: asyncio.AbstractEventLoop, data: bytes) -> None:
+        """Write a request frame to the pipe."""
+        if self._writer is not None:
+            self._writer.write(data)
+            await self._writer.drain()
+        elif self.handle is not None:
+            await loop.run_in_executor(None, win32file.WriteFile, self.handle, data)
+        else:
+            raise PipeClientError("Not connected to pipe")
+    
+    async def _read(self, loop: asyncio.AbstractEventLoop) -> bytes:
+        """Read one or more complete response lines from the pipe."""
+        if self._reader is not None:
+            line = await self._reader.readline()
+            if not line:
+                raise PipeClientError("Empty response from pipe")
+            return line
+        return await loop.run_in_executor(None, self._read_response_blocking)
+    
+    async def _read_responses(self) -> None:
+        """Read responses from the pipe and resolve the matching request futures."""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._in_flight > 0:
+                response_data = await self._read(loop)
                 
-                # Parse the response
-                try:
-                    response = json.loads(response_data)
-                    if "error" in response:
-                        raise PipeClientError(f"Service error: {response['error']}")
-                    return response.get("result", {})
-                except json.JSONDecodeError as e:
-                    raise PipeClientError(f"Invalid JSON response: {response_data}") from e
+                # A single read may carry several newline-delimited responses
+                for line in response_data.split(b"\n"):
+                    if not line.strip():
+                        continue
+                    self._in_flight -= 1
+                    try:
+                        response = _json_loads(line)
+                    except json.JSONDecodeError:
+                        # The stream can't be resynchronized after a bad frame
+                        raise PipeClientError(f"Invalid JSON response: {line!r}") from None
+                    if not isinstance(response, dict):
+                        raise PipeClientError(f"Invalid response: {line!r}")
                     
-            except pywintypes.error as e:
-                self.handle = None  # Mark as disconnected
-                raise PipeClientError(f"Pipe communication error: {e}") from e
+                    future = self._pending.pop(response.get("id"), None)
+                    if future is None and self._pending:
+                        # A null or unknown id (e.g. a parse error reply) can't
+                        # be matched; the service answers in order, so it
+                        # belongs to the oldest request still waiting
+                        future = self._pending.pop(next(iter(self._pending)))
+                        if "error" not in response:
+                            response = {"error": f"Response with unknown id: {response.get('id')!r}"}
+                    if future is not None and not future.done():
+                        future.set_result(response)
+                        
+        except Exception as e:
+            # Covers over-long lines (ValueError from the stream reader) too;
+            # after any failure the stream is out of sync
+            self._reset(PipeClientError(f"Pipe communication error: {e}"))
+    
+    def _reset(self, error: PipeClientError) -> None:
+        """Drop the connection and fail every request waiting on it."""
+        reader_task = self._reader_task
+        self._reader_task = None
+        if reader_task is not None and reader_task is not asyncio.current_task():
+            reader_task.cancel()
+        self._mark_disconnected()
+        self._fail_pending(error)
+    
+    def _fail_pending(self, error: PipeClientError) -> None:
+        """Fail all requests that are still waiting for a response."""
+        pending, self._pending = self._pending, {}
+        self._in_flight = 0
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
     
-    def _read_response_blocking(self) -> str:
+    def _read_response_blocking(self) -> bytes:
         """Blocking implementation of reading a response from the pipe."""
         if self.handle is None:
             raise PipeClientError("Not connected to pipe")
@@ -154,14 +326,14 @@ class PipeClient:
         while True:
             try:
                 # Read a chunk of data
-                _, data = win32file.ReadFile(self.handle, 4096)
+                _, data = win32file.ReadFile(self.handle, READ_CHUNK_SIZE)
                 if not data:
                     break
                     
                 buffer.extend(data)
                 
-                # Check for newline terminator
-                if buffer.endswith(b"\n"):
+                # The newline terminator can only be the last byte of a chunk
+                if data[-1] == 0x0A:
                     break
                     
             except pywintypes.error as e:
@@ -172,8 +344,11 @@ class PipeClient:
         if not buffer:
             raise PipeClientError("Empty response from pipe")
             
-        # Remove the newline terminator and decode
-        return buffer.rstrip().decode('utf-8')
+        # Drop the newline terminator in place rather than scanning for
+        # whitespace; the JSON decoder accepts bytes directly
+        if buffer[-1] == 0x0A:
+            del buffer[-1]
+        return bytes(buffer)
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -34,6 +34,12 @@ setup(
             "sphinx-rtd-theme>=0.5.2",
             "sphinx-autodoc-typehints>=1.12.0",
         ],
+        "speedups": [
+            "orjson>=3.8.0",
+            "blake3>=0.3.4",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "winloop>=0.1.0; sys_platform == 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
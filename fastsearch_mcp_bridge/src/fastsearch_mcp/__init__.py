@@ -4,135 +4,150 @@ FastSearch MCP Bridge - Python implementation of the MCP 2.11.3 protocol.
 This package provides a Python implementation of the Model-Controller-Presenter (MCP) 2.11.3 protocol
 for the FastSearch NTFS search service. It includes a server implementation, tool registration system,
 and various utilities for building MCP-compliant services.
+
+Public names are resolved lazily on first access (PEP 562), so importing the
+package does not pull in the server, the IPC layer or any of the tools. Logging
+is configured by the entry points, not at import time.
 """
 
-import os
-import sys
-from pathlib import Path
-from typing import Optional, Union
-
-# Set up basic logging first to capture any import-time issues
-try:
-    from .logging_config import get_logger, setup_logging
-    
-    # Set up basic console logging with default settings
-    setup_logging(
-        log_level=os.environ.get('FASTSEARCH_LOG_LEVEL', 'INFO'),
-        console=True
-    )
-    logger = get_logger(__name__)
-    
-except Exception as e:
-    import logging
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
-    logger.warning("Failed to initialize logging: %s", e, exc_info=True)
-
-# Now import other modules
-try:
-    from .mcp_server import McpServer
-    from .ipc import IpcError
-    from .exceptions import McpError
-    from .tools import ToolRegistry, tool, ToolInfo
-    from .logging_config import struct_message
-    
-    # Create a global registry instance
-    _global_registry = ToolRegistry()
-    
-    def get_global_registry() -> ToolRegistry:
-        """Get the global tool registry."""
-        return _global_registry
-    
-    def register_tool(func) -> None:
-        """Register a function as a tool in the global registry."""
-        _global_registry.register(func)
-        return func
-        
-    # Import tools to ensure they're registered
-    try:
-        from .tools.file_search import FileContentSearchTool  # noqa
-        from .tools.disk_analyzer import DiskAnalyzerTool  # noqa
-        from .tools.duplicate_finder import DuplicateFileFinderTool  # noqa
-        from .tools.resource_monitor import SystemResourceMonitorTool, ProcessInfoTool  # noqa
-        from .tools.integrity_checker import FileIntegrityCheckerTool, FileHasherTool  # noqa
-        from .tools.service_manager import (  # noqa
-            ListServicesTool, GetServiceTool, StartServiceTool, 
-            StopServiceTool, RestartServiceTool, SetServiceStartupTypeTool,
-            GetServiceLogsTool, ServiceManager, ServiceInfo, ServiceStatus, 
-            ServiceStartupType
-        )
-        
-        __all__ = [
-            # Tool classes
-            'FileContentSearchTool',
-            'DiskAnalyzerTool',
-            'DuplicateFileFinderTool',
-            'SystemResourceMonitorTool',
-            'ProcessInfoTool',
-            'FileIntegrityCheckerTool',
-            'FileHasherTool',
-            
-            # Service management tools
-            'ListServicesTool',
-            'GetServiceTool',
-            'StartServiceTool',
-            'StopServiceTool',
-            'RestartServiceTool',
-            'SetServiceStartupTypeTool',
-            'GetServiceLogsTool',
-            'ServiceManager',
-            'ServiceInfo',
-            'ServiceStatus',
-            'ServiceStartupType',
-            
-            # Core classes
-            'McpServer',
-            'IpcError',
-            'McpError',
-            'ToolRegistry',
-            'tool',
-            'ToolInfo',
-            'get_global_registry',
-            'register_tool',
-            'struct_message'
-        ]
-    except ImportError as e:
-        logger.warning("Failed to import some tools: %s", e)
-    
-    # Import and register all built-in tools
-    from .tools.help import help  # noqa
-    
-    # Import and register service management tools
-    try:
-        from .tools.service import register_tools as register_service_tools
-        register_service_tools(_global_registry)
-    except ImportError as e:
-        logger.warning("Could not register service tools: %s", e)
-    
-    # Import and register NTFS health check tools
-    try:
-        from .tools.ntfs import register_tools as register_ntfs_tools
-        register_ntfs_tools(_global_registry)
-    except ImportError as e:
-        logger.warning("Could not register NTFS tools: %s", e)
-    
-    # Log successful initialization
-    logger.info("FastSearch MCP Bridge initialized (version: %s)", __version__)
-    
-except Exception as e:
-    logger.error("Failed to initialize FastSearch MCP Bridge: %s", e, exc_info=True)
-    raise
+import importlib
+from typing import Any, List
+
+from .logging_config import get_logger, setup_logging, struct_message
 
 __version__ = "0.4.0"
+
+logger = get_logger(__name__)
+
+# Attribute name -> module that defines it, imported on first access
+_LAZY_ATTRS = {
+    # Core classes
+    'McpServer': '.mcp_server',
+    'IpcError': '.ipc',
+    'McpError': '.exceptions',
+    'ToolRegistry': '.tools',
+    'tool': '.tools',
+    'ToolInfo': '.tools',
+
+    # Tool classes
+    'FileContentSearchTool': '.tools.file_search',
+    'DiskAnalyzerTool': '.tools.disk_analyzer',
+    'DuplicateFileFinderTool': '.tools.duplicate_finder',
+    'SystemResourceMonitorTool': '.tools.resource_monitor',
+    'ProcessInfoTool': '.tools.resource_monitor',
+    'FileIntegrityCheckerTool': '.tools.integrity_checker',
+    'FileHasherTool': '.tools.integrity_checker',
+
+    # Service management tools
+    'ListServicesTool': '.tools.service_manager',
+    'GetServiceTool': '.tools.service_manager',
+    'StartServiceTool': '.tools.service_manager',
+    'StopServiceTool': '.tools.service_manager',
+    'RestartServiceTool': '.tools.service_manager',
+    'SetServiceStartupTypeTool': '.tools.service_manager',
+    'GetServiceLogsTool': '.tools.service_manager',
+    'ServiceManager': '.tools.service_manager',
+    'ServiceInfo': '.tools.service_manager',
+    'ServiceStatus': '.tools.service_manager',
+    'ServiceStartupType': '.tools.service_manager',
+}
+
+# Built-in tool modules that register themselves when imported
+_SELF_REGISTERING_TOOL_MODULES = (
+    '.tools.file_search',
+    '.tools.disk_analyzer',
+    '.tools.duplicate_finder',
+    '.tools.resource_monitor',
+    '.tools.integrity_checker',
+    '.tools.service_manager',
+    '.tools.help',
+)
+
+# Built-in tool modules that expose a register_tools(registry) function
+_REGISTRY_TOOL_MODULES = (
+    '.tools.service',
+    '.tools.ntfs',
+)
+
+_global_registry = None
+_tools_registered = False
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+def _get_registry():
+    """The global tool registry, created on first use but not populated."""
+    global _global_registry
+    if _global_registry is None:
+        from .tools import ToolRegistry
+        _global_registry = ToolRegistry()
+    return _global_registry
+
+
+def get_global_registry():
+    """Get the global tool registry, with the built-in tools registered."""
+    return ensure_tools_registered()
+
+
+def register_tool(func):
+    """Register a function as a tool in the global registry."""
+    get_global_registry().register(func)
+    return func
+
+
+def ensure_tools_registered():
+    """Import the built-in tools and register them with the global registry.
+
+    Safe to call repeatedly; the tools are only imported and registered once.
+
+    Returns:
+        The global tool registry.
+    """
+    global _tools_registered
+    registry = _get_registry()
+    if _tools_registered:
+        return registry
+    # Set first: the tool modules register through get_global_registry()
+    _tools_registered = True
+
+    # One broken tool module must not keep the others from registering
+    for module_name in _SELF_REGISTERING_TOOL_MODULES:
+        try:
+            importlib.import_module(module_name, __name__)
+        except Exception as e:
+            logger.warning("Failed to import tools from %s: %s", module_name, e)
+
+    for module_name in _REGISTRY_TOOL_MODULES:
+        try:
+            importlib.import_module(module_name, __name__).register_tools(registry)
+        except Exception as e:
+            logger.warning("Could not register tools from %s: %s", module_name, e)
+
+    return registry
+
+
 __all__ = [
-    "McpServer", 
-    "IpcError", 
+    "McpServer",
+    "IpcError",
     "McpError",
     "ToolRegistry",
     "ToolInfo",
     "tool",
     "register_tool",
     "get_global_registry",
+    "ensure_tools_registered",
     "get_logger",
     "setup_logging",
     "struct_message"
@@ -1,80 +1,35 @@
 """Main entry point for the FastSearch MCP bridge."""
 
-import argparse
 import asyncio
 import logging
-import os
-import signal
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from . import __version__
-from .mcp_server import McpServer
+from ._args import configure_event_loop, is_version_request, parse_args, print_version
 
+if TYPE_CHECKING:
+    import argparse
 
-def parse_args(args=None):
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(description="FastSearch MCP Bridge")
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"%(prog)s {__version__}",
-        help="Show version and exit",
-    )
-    parser.add_argument(
-        "--service-pipe",
-        default=os.getenv("FASTSEARCH_PIPE", r"\\.\pipe\fastsearch-service"),
-        help="Path to FastSearch service pipe (default: %(default)s)",
-    )
-    parser.add_argument(
-        "--log-level",
-        default=os.getenv("LOG_LEVEL", "INFO"),
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        help="Logging level (default: %(default)s)",
-    )
-    return parser.parse_args(args)
 
-
-async def async_main(args: argparse.Namespace):
+async def async_main(args: 'argparse.Namespace'):
     """Async entry point for the MCP server."""
     # Configure logging
     logging.basicConfig(
-        level=args.log_level,
+        level="DEBUG" if args.debug else args.log_level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
     logger = logging.getLogger("fastsearch_mcp")
     
-    # Set up signal handlers
-    shutdown_event = asyncio.Event()
-    
-    def signal_handler(signum, frame):
-        signame = signal.Signals(signum).name
-        logger.info(f"Received signal {signame}, shutting down...")
-        shutdown_event.set()
+    # Imported here so --version and --help don't load the server
+    from .mcp_server import McpServer
     
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        signal.signal(sig, signal_handler)
-    
-    # Create and start the MCP server
-    server = McpServer(service_pipe=args.service_pipe)
+    # Create the MCP server
+    server = McpServer(service_pipe=args.pipe)
     
     try:
-        # Start the server in a task
-        server_task = asyncio.create_task(server.start())
-        
-        # Wait for shutdown signal or server task completion
-        await asyncio.wait(
-            [shutdown_event.wait(), server_task],
-            return_when=asyncio.FIRST_COMPLETED
-        )
-        
-        # If we're here because of the shutdown event, cancel the server task
-        if not server_task.done():
-            server_task.cancel()
-            try:
-                await server_task
-            except asyncio.CancelledError:
-                pass
+        # Serve until stdin closes or a shutdown signal arrives; the server
+        # installs the SIGINT/SIGTERM handlers on the running loop
+        await server.serve()
     
     except Exception as e:
         logger.exception("Fatal error in MCP server")
@@ -84,11 +39,21 @@ async def async_main(args: argparse.Namespace):
     return 0
 
 
-def main(args: Optional[argparse.Namespace] = None):
+def main(args: Optional['argparse.Namespace'] = None):
     """Main entry point."""
     if args is None:
+        # Answer a bare --version without building the argument parser
+        if is_version_request():
+            print_version()
+            return 0
         args = parse_args()
     
+    if args.version:
+        print_version()
+        return 0
+    
+    configure_event_loop(args.fast_loop)
+    
     try:
         return asyncio.run(async_main(args))
     except KeyboardInterrupt:
@@ -100,4 +65,4 @@ def main(args: Optional[argparse.Namespace] = None):
 
 
 if __name__ == "__main__":
-    sys.exit(main(parse_args()))
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Command-line support shared by the FastSearch MCP Bridge entry points.
+
+Both ``python -m fastsearch_mcp`` and the ``fastsearch-mcp`` console script
+parse the same options with the parser built here.
+"""
+
+import functools
+import os
+import sys
+from typing import TYPE_CHECKING, List, Optional
+
+# argparse is imported when the parser is built, so a bare --version never loads it
+if TYPE_CHECKING:
+    import argparse
+
+DEFAULT_PIPE = r'\\.\pipe\fastsearch-service'
+
+@functools.lru_cache(maxsize=1)
+def build_parser() -> 'argparse.ArgumentParser':
+    """Build the command-line parser; it is built at most once per process."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='FastSearch MCP 2.11.3 Server',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+
+    # Connection options
+    connection_group = parser.add_argument_group('Connection Options')
+    connection_group.add_argument(
+        '--pipe',
+        '--service-pipe',
+        dest='pipe',
+        type=str,
+        default=os.environ.get('FASTSEARCH_PIPE', DEFAULT_PIPE),
+        help='Named pipe for FastSearch service communication',
+    )
+
+    # Logging options
+    logging_group = parser.add_argument_group('Logging Options')
+    logging_group.add_argument(
+        '--log-level',
+        type=str,
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+        default=os.environ.get('FASTSEARCH_LOG_LEVEL', os.environ.get('LOG_LEVEL', 'INFO')),
+        help='Set the logging level',
+    )
+    logging_group.add_argument(
+        '--log-file',
+        type=str,
+        default=None,
+        help='Path to log file (default: no file logging)',
+    )
+    logging_group.add_argument(
+        '--log-max-size',
+        type=int,
+        default=10,  # MB
+        help='Maximum log file size in MB before rotation',
+    )
+    logging_group.add_argument(
+        '--log-backup-count',
+        type=int,
+        default=5,
+        help='Number of backup log files to keep',
+    )
+
+    # Service options
+    service_group = parser.add_argument_group('Service Options')
+    service_group.add_argument(
+        '--service-name',
+        type=str,
+        default='FastSearchMCP',
+        help='Name of the Windows service',
+    )
+
+    # General options
+    general_group = parser.add_argument_group('General Options')
+    general_group.add_argument(
+        '-V',
+        '--version',
+        action='store_true',
+        help='Show version information and exit',
+    )
+    general_group.add_argument(
+        '--debug',
+        action='store_true',
+        help='Enable debug mode (sets log level to DEBUG)',
+    )
+    general_group.add_argument(
+        '--fast-loop',
+        action='store_true',
+        help='Use winloop for the event loop on Windows (uvloop is used elsewhere whenever it is installed)',
+    )
+
+    return parser
+
+def parse_args(args: Optional[List[str]] = None) -> 'argparse.Namespace':
+    """Parse command-line arguments."""
+    return build_parser().parse_args(args)
+
+def is_version_request(args: Optional[List[str]] = None) -> bool:
+    """Whether the command line is a bare ``--version`` or ``-V``.
+
+    Lets the entry points answer it without importing argparse or building
+    the parser.
+    """
+    args = sys.argv[1:] if args is None else list(args)
+    return len(args) == 1 and args[0] in ('--version', '-V')
+
+def print_version() -> None:
+    """Print the version information."""
+    from . import __version__
+    print(f'FastSearch MCP Bridge v{__version__}')
+
+def install_fast_event_loop() -> bool:
+    """Install uvloop, or winloop on Windows, as the event loop policy.
+
+    Returns:
+        True if a faster event loop was installed, False if it isn't available.
+    """
+    try:
+        if sys.platform == 'win32':
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return False
+
+    fast_loop.install()
+    return True
+
+def configure_event_loop(fast_loop: bool = False) -> None:
+    """Choose the event loop for the entry points.
+
+    uvloop is installed whenever it is available outside Windows. On Windows
+    the default proactor loop is kept unless ``fast_loop`` asks for winloop,
+    since the IPC client's overlapped named pipe I/O needs the proactor and
+    falls back to thread-pool I/O without it.
+    """
+    if fast_loop:
+        if not install_fast_event_loop():
+            print('Fast event loop is not installed, using the default event loop', file=sys.stderr)
+    elif sys.platform != 'win32':
+        install_fast_event_loop()
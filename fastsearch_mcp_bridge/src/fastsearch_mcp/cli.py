@@ -5,92 +5,26 @@ This module provides a command-line interface for starting and managing the
 FastSearch MCP Bridge server.
 """
 
-import argparse
 import asyncio
 import logging
 import os
 import signal
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 
-from .mcp_server import McpServer
-from .exceptions import McpError
-from .ipc import IpcError
-from .logging_config import setup_logging, get_logger, log_system_info, struct_message
+from ._args import configure_event_loop, is_version_request, parse_args, print_version
+from .logging_config import get_logger
+
+# The server and its dependencies are imported only when it is started, so
+# --version and --help don't pay for them
+if TYPE_CHECKING:
+    from .mcp_server import McpServer
 
 # Get logger
 logger = get_logger(__name__)
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments."""
-    parser = argparse.ArgumentParser(
-        description='FastSearch MCP 2.11.3 Server',
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter
-    )
-    
-    # Connection options
-    connection_group = parser.add_argument_group('Connection Options')
-    connection_group.add_argument(
-        '--pipe',
-        type=str,
-        default=r'\\.\pipe\fastsearch-service',
-        help='Named pipe for FastSearch service communication',
-    )
-    
-    # Logging options
-    logging_group = parser.add_argument_group('Logging Options')
-    logging_group.add_argument(
-        '--log-level',
-        type=str,
-        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
-        default=os.environ.get('FASTSEARCH_LOG_LEVEL', 'INFO'),
-        help='Set the logging level',
-    )
-    logging_group.add_argument(
-        '--log-file',
-        type=str,
-        default=None,
-        help='Path to log file (default: no file logging)',
-    )
-    logging_group.add_argument(
-        '--log-max-size',
-        type=int,
-        default=10,  # MB
-        help='Maximum log file size in MB before rotation',
-    )
-    logging_group.add_argument(
-        '--log-backup-count',
-        type=int,
-        default=5,
-        help='Number of backup log files to keep',
-    )
-    
-    # Service options
-    service_group = parser.add_argument_group('Service Options')
-    service_group.add_argument(
-        '--service-name',
-        type=str,
-        default='FastSearchMCP',
-        help='Name of the Windows service',
-    )
-    
-    # General options
-    general_group = parser.add_argument_group('General Options')
-    general_group.add_argument(
-        '--version',
-        action='store_true',
-        help='Show version information and exit',
-    )
-    general_group.add_argument(
-        '--debug',
-        action='store_true',
-        help='Enable debug mode (sets log level to DEBUG)',
-    )
-    
-    return parser.parse_args()
-
-async def shutdown(server: McpServer) -> None:
+async def shutdown(server: 'McpServer') -> None:
     """Shut down the server gracefully."""
     logger.info('Initiating graceful shutdown...')
     try:
@@ -99,19 +33,27 @@ async def shutdown(server: McpServer) -> None:
     except Exception as e:
         logger.error('Error during shutdown: %s', e, exc_info=True)
     finally:
-        # Ensure the event loop is stopped
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.stop()
-        except Exception as e:
-            logger.error('Error stopping event loop: %s', e)
+        # Cancel the remaining tasks and let them finish unwinding; the loop
+        # itself is torn down by whoever runs it
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-def handle_signal(server: McpServer, signal_name: str) -> None:
+def handle_signal(server: 'McpServer', signal_name: str) -> None:
     """Handle OS signals for graceful shutdown."""
     logger.info('Received %s signal. Initiating graceful shutdown...', signal_name)
     asyncio.create_task(shutdown(server))
 
+def handle_exception(server: 'McpServer', loop: asyncio.AbstractEventLoop, context: Dict[str, Any]) -> None:
+    """Handle exceptions that escaped a task by shutting down gracefully."""
+    logger.error(
+        'Unhandled exception in event loop: %s',
+        context.get('exception', context['message']),
+        exc_info=context.get('exception')
+    )
+    loop.create_task(shutdown(server))
+
 def print_banner() -> None:
     """Print the application banner."""
     from . import __version__
@@ -125,11 +67,16 @@ def print_banner() -> None:
     print(banner)
     logger.debug("Debug mode enabled")
 
-def setup_signal_handlers(server: McpServer) -> None:
+def setup_signal_handlers(server: 'McpServer') -> None:
     """Set up signal handlers for graceful shutdown."""
     try:
         loop = asyncio.get_event_loop()
         
+        # Route unhandled task exceptions through the same shutdown path
+        loop.set_exception_handler(
+            lambda loop, context: handle_exception(server, loop, context)
+        )
+        
         # Handle common termination signals
         for sig in (signal.SIGINT, signal.SIGTERM):
             try:
@@ -137,7 +84,7 @@ def setup_signal_handlers(server: McpServer) -> None:
                     sig,
                     lambda s=sig: handle_signal(server, s.name)
                 )
-            except (ValueError, RuntimeError) as e:
+            except (NotImplementedError, ValueError, RuntimeError) as e:
                 # Handle cases where signal can't be added (e.g., on Windows)
                 logger.debug("Could not add signal handler for %s: %s", sig.name, e)
     except Exception as e:
@@ -149,18 +96,16 @@ async def run_server(pipe_name: str) -> None:
     Args:
         pipe_name: Name of the named pipe for communication
     """
+    from .mcp_server import McpServer
+    
     # Create and configure the server
-    server = McpServer(pipe_name=pipe_name)
+    server = McpServer(service_pipe=pipe_name)
     
     try:
-        # Start the server
+        # Serve until stdin closes or a shutdown is requested
         logger.info("Starting MCP server (pipe: %s)", pipe_name)
-        await server.start()
+        await server.serve()
         
-        # Keep the server running until stopped
-        while True:
-            await asyncio.sleep(1)
-            
     except asyncio.CancelledError:
         logger.info("Server shutdown requested")
     except Exception as e:
@@ -172,14 +117,22 @@ async def run_server(pipe_name: str) -> None:
 
 def main() -> int:
     """Run the MCP server."""
+    # Answer a bare --version without building the argument parser
+    if is_version_request():
+        print_version()
+        return 0
+    
     args = parse_args()
     
     # Handle version flag
     if args.version:
-        from . import __version__
-        print(f'FastSearch MCP Bridge v{__version__}')
+        print_version()
         return 0
     
+    configure_event_loop(args.fast_loop)
+    
+    from .logging_config import setup_logging, log_system_info, struct_message
+    
     # Set up logging
     log_level = 'DEBUG' if args.debug else args.log_level
     log_file = os.path.abspath(args.log_file) if args.log_file else None
@@ -210,18 +163,20 @@ def main() -> int:
     
     # Log configuration
     logger.info("Starting FastSearch MCP Bridge")
-    logger.debug("Command line arguments: %s", sys.argv)
-    logger.debug("Effective configuration: %s", struct_message("", **{
-        'pipe': args.pipe,
-        'log_level': log_level,
-        'log_file': log_file,
-        'log_max_size': f"{args.log_max_size}MB",
-        'log_backup_count': args.log_backup_count,
-        'service_name': args.service_name,
-    }))
-    
-    # Log system information
-    log_system_info(logger)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Command line arguments: %s", sys.argv)
+        logger.debug("Effective configuration: %s", struct_message("", **{
+            'pipe': args.pipe,
+            'log_level': log_level,
+            'log_file': log_file,
+            'log_max_size': f"{args.log_max_size}MB",
+            'log_backup_count': args.log_backup_count,
+            'service_name': args.service_name,
+        }))
+    
+    # Log system information; the disk probes are skipped when INFO is disabled
+    if logger.isEnabledFor(logging.INFO):
+        log_system_info(logger)
     
     # Create and configure the server
     try:
@@ -242,9 +197,20 @@ def main() -> int:
                     getattr(signal, signame),
                     signal_handler
                 )
-            except (ValueError, RuntimeError) as e:
+            except (NotImplementedError, ValueError, RuntimeError) as e:
                 logger.warning("Could not add signal handler for %s: %s", signame, e)
         
+        # Unhandled exceptions in background tasks also stop the server
+        def exception_handler(loop, context):
+            logger.error(
+                "Unhandled exception in event loop: %s",
+                context.get("exception", context["message"]),
+                exc_info=context.get("exception")
+            )
+            server_task.cancel()
+        
+        loop.set_exception_handler(exception_handler)
+        
         # Run the server until it's complete
         loop.run_until_complete(server_task)
         
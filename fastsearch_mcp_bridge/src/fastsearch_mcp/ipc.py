@@ -1,11 +1,13 @@
 """IPC client for FastSearch Windows Service communication."""
 
 import asyncio
+import collections
 import json
 import logging
 import os
 import struct
-from typing import Any, Dict, List, Optional, Tuple
+import weakref
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import pywintypes
 import win32file
@@ -13,6 +15,17 @@ import win32pipe
 import win32security
 from win32 import win32api
 
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # Constants for pipe communication
@@ -21,6 +34,12 @@ BUFFER_SIZE = 65536
 CONNECT_TIMEOUT = 5000  # ms
 IO_TIMEOUT = 30000  # ms
 
+# Message and response header: 4 bytes for type/status + 4 bytes for data length
+HEADER = struct.Struct("<II")
+
+# Windows error returned when a message-mode read leaves the rest of the message pending
+ERROR_MORE_DATA = 234
+
 # Message types
 MSG_SEARCH = 1
 MSG_STATUS = 2
@@ -51,8 +70,31 @@ class IpcProtocolError(IpcError):
     pass
 
 
+def _close_handle(handle) -> None:
+    """Close a raw pipe handle.
+    
+    Used as the client's finalizer, so it must not touch the client itself.
+    """
+    try:
+        win32file.CloseHandle(handle)
+    except pywintypes.error:
+        pass
+
+
 class FastSearchClient:
-    """Client for communicating with the FastSearch Windows Service."""
+    """Client for communicating with the FastSearch Windows Service.
+    
+    On a ``ProactorEventLoop`` (the default on Windows) the pipe is opened for
+    overlapped I/O, so requests suspend the calling coroutine instead of blocking
+    the event loop. Other event loops fall back to a blocking pipe handle that is
+    driven from the default executor.
+    
+    A single connection is kept open and shared by all requests. Requests are
+    written back to back without waiting for earlier responses, and a background
+    reader resolves them as responses arrive. The service answers the requests on
+    a pipe instance in the order they were sent, so responses are matched to
+    requests first-in, first-out.
+    """
 
     def __init__(self, pipe_name: str = PIPE_NAME):
         """Initialize the FastSearch client.
@@ -62,8 +104,18 @@ class FastSearchClient:
         """
         self.pipe_name = pipe_name
         self.pipe_handle = None
+        # Closes pipe_handle if the client is garbage collected while connected
+        self._finalizer: Optional[weakref.finalize] = None
+        # Overlapped I/O streams, set when connected through the proactor
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
         self.connected = False
         self._lock = asyncio.Lock()
+        # Guards writes so concurrent requests don't interleave on the pipe
+        self._write_lock = asyncio.Lock()
+        # Requests awaiting a response, in the order they were written
+        self._pending: Deque[asyncio.Future] = collections.deque()
+        self._reader_task: Optional[asyncio.Task] = None
         self._connect_task = None
 
     async def connect(self) -> None:
@@ -76,41 +128,40 @@ class FastSearchClient:
             if self.connected:
                 return
 
+            loop = asyncio.get_running_loop()
             try:
-                # Try to open the named pipe
-                self.pipe_handle = win32file.CreateFile(
-                    self.pipe_name,
-                    win32file.GENERIC_READ | win32file.GENERIC_WRITE,
-                    0,  # No sharing
-                    None,  # Default security
-                    win32file.OPEN_EXISTING,
-                    win32file.FILE_FLAG_OVERLAPPED,
-                    None  # Template file
-                )
-                
-                # Set read mode and blocking mode
-                win32pipe.SetNamedPipeHandleState(
-                    self.pipe_handle,
-                    win32pipe.PIPE_READMODE_MESSAGE,
-                    None,
-                    None
-                )
+                if hasattr(loop, "create_pipe_connection"):
+                    reader = asyncio.StreamReader()
+                    transport, protocol = await asyncio.wait_for(
+                        loop.create_pipe_connection(
+                            lambda: asyncio.StreamReaderProtocol(reader),
+                            self.pipe_name
+                        ),
+                        CONNECT_TIMEOUT / 1000
+                    )
+                    self._reader = reader
+                    self._writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+                else:
+                    self.pipe_handle = await loop.run_in_executor(None, self._open_pipe)
+                    self._finalizer = weakref.finalize(self, _close_handle, self.pipe_handle)
                 
                 self.connected = True
                 logger.info(f"Connected to FastSearch service at {self.pipe_name}")
                 
-            except pywintypes.error as e:
+            except asyncio.TimeoutError as e:
+                raise IpcTimeoutError(
+                    f"Timed out connecting to FastSearch service at {self.pipe_name}"
+                ) from e
+            except (pywintypes.error, OSError) as e:
                 self.connected = False
-                if self.pipe_handle:
-                    win32file.CloseHandle(self.pipe_handle)
-                    self.pipe_handle = None
+                winerror = getattr(e, "winerror", None)
                 
-                if e.winerror == 2:  # File not found
+                if winerror == 2:  # File not found
                     raise IpcConnectionError(
                         f"FastSearch service not found at {self.pipe_name}. "
                         "Is the service running?"
                     )
-                elif e.winerror == 231:  # All pipe instances busy
+                elif winerror == 231:  # All pipe instances busy
                     raise IpcConnectionError(
                         "All FastSearch service instances are busy. Please try again later."
                     )
@@ -119,13 +170,58 @@ class FastSearchClient:
                         f"Failed to connect to FastSearch service: {e.strerror}"
                     ) from e
 
+    def _open_pipe(self) -> int:
+        """Open a blocking pipe handle; runs in the default executor."""
+        handle = win32file.CreateFile(
+            self.pipe_name,
+            win32file.GENERIC_READ | win32file.GENERIC_WRITE,
+            0,  # No sharing
+            None,  # Default security
+            win32file.OPEN_EXISTING,
+            0,  # Synchronous I/O, driven from the executor
+            None  # Template file
+        )
+        
+        try:
+            # Set read mode and blocking mode
+            win32pipe.SetNamedPipeHandleState(
+                handle,
+                win32pipe.PIPE_READMODE_MESSAGE,
+                None,
+                None
+            )
+        except pywintypes.error:
+            win32file.CloseHandle(handle)
+            raise
+        
+        return handle
+
+    def _close_pipe(self, error: Optional[IpcError] = None) -> None:
+        """Drop the connection state, release the pipe and fail pending requests."""
+        if self._reader_task is not None and self._reader_task is not asyncio.current_task():
+            self._reader_task.cancel()
+        self._reader_task = None
+        
+        pending, self._pending = self._pending, collections.deque()
+        for future in pending:
+            if not future.done():
+                future.set_exception(error or IpcConnectionError("Disconnected from service"))
+        
+        if self._writer is not None:
+            self._writer.close()
+            self._reader = None
+            self._writer = None
+        if self._finalizer is not None:
+            # Closes the handle now; a finalizer only ever runs once
+            self._finalizer()
+            self._finalizer = None
+        self.pipe_handle = None
+        self.connected = False
+
     async def disconnect(self) -> None:
         """Disconnect from the FastSearch service."""
         async with self._lock:
-            if self.pipe_handle:
-                win32file.CloseHandle(self.pipe_handle)
-                self.pipe_handle = None
-            self.connected = False
+            self._close_pipe()
 
     async def _ensure_connected(self) -> None:
         """Ensure we're connected to the service."""
@@ -145,54 +241,132 @@ class FastSearchClient:
         Raises:
             IpcError: If communication fails
         """
-        async with self._lock:
-            await self._ensure_connected()
-            
-            # Prepare message header: 4 bytes for message type + 4 bytes for data length
-            header = struct.pack("<II", message_type, len(data))
-            message = header + data
-            
-            try:
-                # Send the message
-                _, err = win32file.WriteFile(self.pipe_handle, message)
-                if err != 0:
-                    raise IpcError(f"Failed to send message: Windows error {err}")
-                
-                # Read response header (8 bytes: 4 for status, 4 for length)
-                hr, header_data = win32file.ReadFile(
-                    self.pipe_handle, 8, None
-                )
-                if hr != 0:
-                    raise IpcError(f"Failed to read response header: Windows error {hr}")
-                
-                status, length = struct.unpack("<II", header_data)
-                
-                # Read response data if any
-                response_data = b""
-                if length > 0:
-                    hr, response_data = win32file.ReadFile(
-                        self.pipe_handle, length, None
-                    )
-                    if hr != 0:
-                        raise IpcError(f"Failed to read response data: Windows error {hr}")
-                
-                # Check status
-                if status == STATUS_ERROR:
-                    error_msg = response_data.decode('utf-8', errors='replace')
-                    raise IpcError(f"Service error: {error_msg}")
-                elif status == STATUS_UNAVAILABLE:
-                    raise IpcError("Service temporarily unavailable")
-                
-                return response_data
+        await self._ensure_connected()
+        
+        # Prepare message header: 4 bytes for message type + 4 bytes for data length
+        header = HEADER.pack(message_type, len(data))
+        message = header + data
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        try:
+            async with self._write_lock:
+                # Queue the waiter in write order so the reader can match responses
+                self._pending.append(future)
+                await self._write(loop, message)
+        except (pywintypes.error, OSError, IpcError) as e:
+            error = self._io_error(e)
+            self._close_pipe(error)
+            if error is e:
+                raise
+            raise error from e
+        
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = loop.create_task(self._read_responses())
+        
+        status, response_data = await future
+        
+        # Check status
+        if status == STATUS_ERROR:
+            error_msg = response_data.decode('utf-8', errors='replace')
+            raise IpcError(f"Service error: {error_msg}")
+        elif status == STATUS_UNAVAILABLE:
+            raise IpcError("Service temporarily unavailable")
+        
+        return response_data
+
+    async def _read_responses(self) -> None:
+        """Read responses from the pipe and resolve pending requests in order."""
+        loop = asyncio.get_running_loop()
+        try:
+            # Only read while requests are outstanding: a blocking read on an
+            # idle handle would hold it and stall the next write
+            while self._pending:
+                status, response_data = await self._read_response(loop)
                 
-            except pywintypes.error as e:
-                self.connected = False
-                if e.winerror == 109:  # Broken pipe
-                    raise IpcConnectionError("Connection to service lost") from e
-                elif e.winerror == 232:  # Pipe busy
-                    raise IpcTimeoutError("Service request timed out") from e
-                else:
-                    raise IpcError(f"IPC communication error: {e.strerror}") from e
+                # Requests whose caller gave up still own their response slot
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_result((status, response_data))
+                    
+        except (pywintypes.error, OSError, asyncio.IncompleteReadError, IpcError) as e:
+            error = self._io_error(e)
+            if error is not e:
+                error.__cause__ = e
+            self._close_pipe(error)
+
+    @staticmethod
+    def _io_error(e: Exception) -> IpcError:
+        """Map a pipe I/O failure to the matching IPC error."""
+        if isinstance(e, IpcError):
+            return e
+        winerror = getattr(e, "winerror", None)
+        if winerror == 109 or isinstance(e, (ConnectionError, asyncio.IncompleteReadError)):
+            return IpcConnectionError("Connection to service lost")
+        elif winerror == 232:  # Pipe busy
+            return IpcTimeoutError("Service request timed out")
+        else:
+            return IpcError(f"IPC communication error: {e.strerror}")
+
+    async def _write(self, loop: asyncio.AbstractEventLoop, data: bytes) -> None:
+        """Write a message to the pipe."""
+        if self._writer is not None:
+            self._writer.write(data)
+            await self._writer.drain()
+        else:
+            err, _ = await loop.run_in_executor(
+                None, win32file.WriteFile, self.pipe_handle, data
+            )
+            if err != 0:
+                raise IpcError(f"Failed to send message: Windows error {err}")
+
+    async def _read_response(self, loop: asyncio.AbstractEventLoop) -> Tuple[int, bytes]:
+        """Read one response frame and return its status and data."""
+        if self._reader is None:
+            return await loop.run_in_executor(None, self._read_response_blocking)
+        
+        # Read response header (8 bytes: 4 for status, 4 for length)
+        status, length = HEADER.unpack(await self._reader.readexactly(HEADER.size))
+        
+        # Read response data if any
+        response_data = b""
+        if length > 0:
+            response_data = await self._reader.readexactly(length)
+        return status, response_data
+
+    def _read_response_blocking(self) -> Tuple[int, bytes]:
+        """Blocking implementation of reading a response frame.
+        
+        A response is a single pipe message, so one read normally returns the
+        header together with the data; only data beyond ``BUFFER_SIZE`` needs
+        further reads.
+        """
+        hr, data = win32file.ReadFile(self.pipe_handle, BUFFER_SIZE, None)
+        # ERROR_MORE_DATA means the message continues past this read
+        if hr not in (0, ERROR_MORE_DATA):
+            raise IpcError(f"Failed to read from pipe: Windows error {hr}")
+        if not data:
+            raise IpcConnectionError("Connection to service lost")
+        if len(data) < HEADER.size:
+            raise IpcProtocolError("Truncated response header from service")
+        
+        status, length = HEADER.unpack_from(data)
+        end = HEADER.size + length
+        if len(data) >= end:
+            return status, data[HEADER.size:end]
+        
+        # The data spans several reads
+        response_data = bytearray(data[HEADER.size:])
+        while len(response_data) < length:
+            hr, chunk = win32file.ReadFile(
+                self.pipe_handle, length - len(response_data), None
+            )
+            if hr not in (0, ERROR_MORE_DATA):
+                raise IpcError(f"Failed to read from pipe: Windows error {hr}")
+            if not chunk:
+                raise IpcConnectionError("Connection to service lost")
+            response_data += chunk
+        return status, bytes(response_data)
 
     async def search(
         self,
@@ -222,9 +396,9 @@ class FastSearchClient:
         try:
             response_data = await self._send_message(
                 MSG_SEARCH,
-                json.dumps(request).encode('utf-8')
+                _json_dumps(request)
             )
-            return json.loads(response_data.decode('utf-8'))
+            return _json_loads(response_data)
             
         except json.JSONDecodeError as e:
             raise IpcProtocolError("Invalid response format from service") from e
@@ -237,7 +411,7 @@ class FastSearchClient:
         """
         try:
             response_data = await self._send_message(MSG_STATUS, b"")
-            return json.loads(response_data.decode('utf-8'))
+            return _json_loads(response_data)
             
         except json.JSONDecodeError as e:
             raise IpcProtocolError("Invalid status response from service") from e
@@ -250,8 +424,3 @@ class FastSearchClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.disconnect()
-
-    def __del__(self):
-        """Ensure resources are cleaned up."""
-        if hasattr(self, 'pipe_handle') and self.pipe_handle:
-            win32file.CloseHandle(self.pipe_handle)
@@ -0,0 +1,52 @@
+"""
+Pydantic models for JSON-RPC 2.0 envelopes.
+
+The MCP server builds and checks envelopes as plain dicts; these models are
+for code that wants validated request and response objects. They are
+re-exported lazily from ``fastsearch_mcp.mcp_server``.
+"""
+
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from .mcp_server import JsonRpcId, JsonRpcParams
+
+
+class JsonRpcRequest(BaseModel):
+    """JSON-RPC 2.0 request model.
+    
+    The server checks request envelopes by hand on its hot path; this model
+    documents the shape and is available to callers that want validation.
+    """
+    
+    jsonrpc: str = Field("2.0", const=True)
+    method: str
+    params: JsonRpcParams = None
+    id: JsonRpcId = None
+    
+    class Config:
+        frozen = True
+
+
+class JsonRpcResponse(BaseModel):
+    """JSON-RPC 2.0 response model."""
+    
+    jsonrpc: str = Field("2.0", const=True)
+    result: Optional[Any] = None
+    error: Optional[Dict[str, Any]] = None
+    id: JsonRpcId
+    
+    class Config:
+        frozen = True
+    
+    @classmethod
+    def success(cls, result: Any, request_id: JsonRpcId):
+        return cls(result=result, id=request_id)
+    
+    @classmethod
+    def error(cls, code: int, message: str, data: Any = None, request_id: JsonRpcId = None):
+        error = {"code": code, "message": message}
+        if data is not None:
+            error["data"] = data
+        return cls(error=error, id=request_id)
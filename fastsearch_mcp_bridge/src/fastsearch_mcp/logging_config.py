@@ -5,12 +5,17 @@ This module provides a centralized logging configuration for the FastSearch MCP
 including file and console handlers, log rotation, and structured logging.
 """
 
+import atexit
+import hashlib
+import json
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import time
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional, Union
 
 # Default log format
 DEFAULT_LOG_FORMAT = (
@@ -35,17 +40,44 @@ DEFAULT_LOG_FILE = 'fastsearch_mcp.log'
 DEFAULT_MAX_BYTES = 10 * 1024 * 1024  # 10 MB
 DEFAULT_BACKUP_COUNT = 5
 
+def _user_cache_dir() -> Path:
+    """The platform's per-user cache directory."""
+    if sys.platform == 'win32':
+        return Path(os.getenv('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local')
+    if sys.platform == 'darwin':
+        return Path.home() / 'Library' / 'Caches'
+    return Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache')
+
+# Cache for log_system_info so warm launches skip the slow platform and disk probes
+SYSTEM_INFO_CACHE_FILE = _user_cache_dir() / 'FastSearchMCP' / 'startup.cache'
+SYSTEM_INFO_TTL = 24 * 60 * 60  # seconds
+DISK_USAGE_TTL = 5 * 60  # seconds
+
+# Bytes per gigabyte, for the sizes reported by log_system_info
+_GB = 1 << 30
+
+# Background thread that writes queued log records to the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
+
 class StructuredMessage:
-    """Structured log message formatter."""
+    """Structured log message formatter.
+    
+    The message is only rendered when a handler formats the record, and the
+    rendered text is reused if it is formatted again.
+    """
     def __init__(self, message: str, **kwargs):
         self.message = message
         self.kwargs = kwargs
+        self._rendered: Optional[str] = None
     
     def __str__(self) -> str:
-        if not self.kwargs:
-            return self.message
-        items = ", ".join(f"{k}={v!r}" for k, v in self.kwargs.items())
-        return f"{self.message} | {items}"
+        if self._rendered is None:
+            if not self.kwargs:
+                self._rendered = self.message
+            else:
+                items = ", ".join(f"{k}={v!r}" for k, v in self.kwargs.items())
+                self._rendered = f"{self.message} | {items}"
+        return self._rendered
 
 # Alias for easier use
 struct_message = StructuredMessage
@@ -63,15 +95,32 @@ class ColorFormatter(logging.Formatter):
         'RESET': '\033[0m',      # Reset
     }
     
+    def __init__(self, *args, use_color: bool = True, **kwargs):
+        """Initialize the formatter.
+        
+        Args:
+            use_color: Whether to wrap messages in color codes, e.g. only
+                when writing to a terminal.
+        """
+        super().__init__(*args, **kwargs)
+        self.use_color = use_color
+        # Color prefix per level name, looked up once per record
+        self._level_prefix = {
+            level: color for level, color in self.COLORS.items() if level != 'RESET'
+        }
+        self._reset = self.COLORS['RESET']
+    
     def format(self, record):
         """Format the specified record as text with color."""
         # Get the original format
         msg = super().format(record)
+        if not self.use_color:
+            return msg
         
-        # Add color if this is a console handler
-        if record.levelname in self.COLORS and hasattr(record, 'colored') and record.colored:
-            return f"{self.COLORS[record.levelname]}{msg}{self.COLORS['RESET']}"
-        return msg
+        prefix = self._level_prefix.get(record.levelname)
+        if prefix is None:
+            return msg
+        return ''.join((prefix, msg, self._reset))
 
 def setup_logging(
     log_level: str = 'INFO',
@@ -85,6 +134,10 @@ def setup_logging(
     """
     Set up logging configuration.
     
+    The logger itself only gets a ``QueueHandler``; console and file output
+    happen on a ``QueueListener`` thread so logging never blocks the event loop
+    on stream or disk I/O.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file. If None, file logging is disabled.
@@ -102,25 +155,22 @@ def setup_logging(
     logger.setLevel(LOG_LEVELS.get(log_level.upper(), logging.INFO))
     
     # Clear existing handlers
+    stop_logging()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    handlers = []
     
     # Create formatters
     formatter = logging.Formatter(log_format, datefmt=date_format)
-    color_formatter = ColorFormatter(log_format, datefmt=date_format)
+    color_formatter = ColorFormatter(
+        log_format, datefmt=date_format, use_color=sys.stderr.isatty()
+    )
     
-    # Add console handler if enabled
+    # Add console handler if enabled; stdout carries the MCP protocol
     if console:
-        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setFormatter(color_formatter)
-        
-        # Add a custom attribute to indicate this is a colored handler
-        def filter_colored(record):
-            record.colored = True
-            return True
-            
-        console_handler.addFilter(filter_colored)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # Add file handler if log file is specified
     if log_file:
@@ -139,7 +189,16 @@ def setup_logging(
             encoding='utf-8'
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Hand records to the listener thread instead of writing them inline
+    global _listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
     
     # Capture warnings from the warnings module
     logging.captureWarnings(True)
@@ -153,6 +212,16 @@ def setup_logging(
     
     return logger
 
+def stop_logging() -> None:
+    """Flush queued log records and stop the logging listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+# Make sure queued records are written before the interpreter exits
+atexit.register(stop_logging)
+
 def get_logger(name: str = None) -> logging.Logger:
     """
     Get a logger with the specified name.
@@ -167,36 +236,107 @@ def get_logger(name: str = None) -> logging.Logger:
         return logging.getLogger('fastsearch_mcp')
     return logging.getLogger(f'fastsearch_mcp.{name}')
 
+def _load_system_info_cache(key: str) -> Dict[str, Any]:
+    """Load the cached system information if it belongs to this host."""
+    try:
+        cache = json.loads(SYSTEM_INFO_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('key') != key:
+        return {}
+    return cache
+
+def _save_system_info_cache(cache: Dict[str, Any]) -> None:
+    """Write the system information cache atomically."""
+    try:
+        SYSTEM_INFO_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # Per-process name, so concurrent launches don't write the same file
+        tmp_file = SYSTEM_INFO_CACHE_FILE.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            tmp_file.write_text(json.dumps(cache), encoding='utf-8')
+            os.replace(tmp_file, SYSTEM_INFO_CACHE_FILE)
+        except OSError:
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+            raise
+    except OSError as e:
+        logger.debug("Failed to write system information cache: %s", e)
+
+def _get_disk_usage(logger: logging.Logger) -> Dict[str, Dict[str, Any]]:
+    """Get usage statistics for every disk partition."""
+    import psutil
+    
+    disk_usage = {}
+    for part in psutil.disk_partitions():
+        try:
+            usage = psutil.disk_usage(part.mountpoint)
+            disk_usage[part.mountpoint] = {
+                'total_gb': round(usage.total / _GB, 1),
+                'used_gb': round(usage.used / _GB, 1),
+                'free_gb': round(usage.free / _GB, 1),
+                'percent_used': usage.percent
+            }
+        except Exception as e:
+            logger.warning("Failed to get disk usage for %s: %s", part.mountpoint, e)
+    return disk_usage
+
 def log_system_info(logger: logging.Logger) -> None:
-    """Log system information."""
+    """Log system information.
+    
+    Host details are cached in ``SYSTEM_INFO_CACHE_FILE`` for a day and disk
+    usage for a few minutes, keyed by platform and hostname.
+    """
+    # Skip the platform and disk probes entirely when nothing would be logged
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     import platform
+    import socket
     import psutil
     
     try:
+        now = time.time()
+        key = hashlib.sha1(
+            f"{platform.platform()}|{socket.gethostname()}".encode('utf-8')
+        ).hexdigest()
+        cache = _load_system_info_cache(key)
+        cache['key'] = key
+        dirty = False
+        
+        # Host details rarely change
+        host_info = cache.get('host_info')
+        if host_info is None or now - cache.get('host_info_time', 0) > SYSTEM_INFO_TTL:
+            host_info = {
+                'platform': platform.platform(),
+                'processor': platform.processor(),
+                'cpu_count': psutil.cpu_count(),
+                'total_memory_gb': round(psutil.virtual_memory().total / _GB, 1),
+            }
+            cache['host_info'] = host_info
+            cache['host_info_time'] = now
+            dirty = True
+        
+        # Disk usage
+        disk_usage = cache.get('disk_usage')
+        if disk_usage is None or now - cache.get('disk_usage_time', 0) > DISK_USAGE_TTL:
+            disk_usage = _get_disk_usage(logger)
+            cache['disk_usage'] = disk_usage
+            cache['disk_usage_time'] = now
+            dirty = True
+        
+        if dirty:
+            _save_system_info_cache(cache)
+        
         # System information
         system_info = {
             'python_version': sys.version,
-            'platform': platform.platform(),
-            'processor': platform.processor(),
-            'cpu_count': psutil.cpu_count(),
-            'total_memory_gb': round(psutil.virtual_memory().total / (1024 ** 3), 1),
-            'available_memory_gb': round(psutil.virtual_memory().available / (1024 ** 3), 1),
-            'disk_usage': {}
+            **host_info,
+            'available_memory_gb': round(psutil.virtual_memory().available / _GB, 1),
+            'disk_usage': disk_usage
         }
         
-        # Disk usage
-        for part in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(part.mountpoint)
-                system_info['disk_usage'][part.mountpoint] = {
-                    'total_gb': round(usage.total / (1024 ** 3), 1),
-                    'used_gb': round(usage.used / (1024 ** 3), 1),
-                    'free_gb': round(usage.free / (1024 ** 3), 1),
-                    'percent_used': usage.percent
-                }
-            except Exception as e:
-                logger.warning("Failed to get disk usage for %s: %s", part.mountpoint, e)
-        
         logger.info("System information: %s", struct_message("", **system_info))
     except Exception as e:
         logger.error("Failed to log system information: %s", e, exc_info=True)
@@ -6,22 +6,71 @@ and follows the MCP 2.11.3 protocol specification.
 """
 
 import asyncio
-import inspect
+import concurrent.futures
+import contextlib
 import json
 import logging
+import os
 import signal
 import sys
-from typing import Any, Dict, List, Optional, Union, Callable, Awaitable, TypeVar, Type, cast
-
-from pydantic import BaseModel, Field, validator, ValidationError
+import threading
+import time
+from functools import wraps
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, Union, Callable, Awaitable, TypeVar
 
+from . import __version__, get_global_registry
 from .ipc import FastSearchClient, IpcError
-from .exceptions import McpError
-from .tools import ToolRegistry, ToolInfo, tool as tool_decorator
+from .tools import ToolRegistry, tool as tool_decorator
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        # json.dumps accepts non-string keys in tool results, so orjson must too
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Longest request line accepted on stdin
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+# Workers that run notification handlers, and how many notifications may
+# wait for one before reading stdin pauses
+NOTIFICATION_WORKERS = 8
+NOTIFICATION_QUEUE_SIZE = 256
+
+# Most pipe connections to the service, so concurrent searches and status
+# checks are served by separate pipe instances instead of queueing on one.
+# Connections beyond the first are only opened while calls overlap
+SERVICE_CONNECTIONS = 4
+
+# Seconds a fastsearch.status result is reused, so rapid polling while the
+# service is down doesn't retry the pipe connection on every call
+STATUS_CACHE_TTL = 0.5
+
+# Requests handled at once; reading stdin pauses while this many are running
+MAX_CONCURRENT_REQUESTS = 16
+
+# Lines read ahead from stdin when it has to be read by a thread
+INPUT_QUEUE_SIZE = 64
+
+# Responses waiting for the stdout writer before request handling pauses, and
+# how long queued responses may take to flush when the server stops
+OUTPUT_QUEUE_SIZE = 64
+OUTPUT_FLUSH_TIMEOUT = 1.0
+
+# Accepted values for fastsearch.search parameters
+_VALID_SEARCH_TYPES = frozenset({"fuzzy", "exact", "regex", "glob"})
+_MAX_RESULTS_RANGE = range(1, 1001)
+
 # Type variables for generic type hints
 T = TypeVar('T')
 
@@ -65,39 +114,43 @@ JsonRpcParams = Union[Dict[str, Any], List[Any], None]
 Handler = Callable[..., Awaitable[Any]]
 
 
-class JsonRpcRequest(BaseModel):
-    """JSON-RPC 2.0 request model."""
-    
-    jsonrpc: str = Field("2.0", const=True)
-    method: str
-    params: JsonRpcParams = None
-    id: JsonRpcId = None
-    
-    @validator('jsonrpc')
-    def validate_jsonrpc_version(cls, v):
-        if v != "2.0":
-            raise ValueError("jsonrpc version must be '2.0'")
-        return v
+# The pydantic models are only for callers that validate envelopes themselves,
+# so pydantic is imported on first access rather than at startup
+_MODEL_ATTRS = ('JsonRpcRequest', 'JsonRpcResponse')
 
 
-class JsonRpcResponse(BaseModel):
-    """JSON-RPC 2.0 response model."""
-    
-    jsonrpc: str = Field("2.0", const=True)
-    result: Optional[Any] = None
-    error: Optional[Dict[str, Any]] = None
-    id: JsonRpcId
-    
-    @classmethod
-    def success(cls, result: Any, request_id: JsonRpcId):
-        return cls(result=result, id=request_id)
+def __getattr__(name: str) -> Any:
+    """Import the JSON-RPC models on first access."""
+    if name not in _MODEL_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import jsonrpc_models
+    value = getattr(jsonrpc_models, name)
+    globals()[name] = value
+    return value
+
+
+def _mcp_safe(func: T) -> T:
+    """Mark a handler as raising nothing but ``JsonRpcError``.
     
-    @classmethod
-    def error(cls, code: int, message: str, data: Any = None, request_id: JsonRpcId = None):
-        error = {"code": code, "message": message}
-        if data is not None:
-            error["data"] = data
-        return cls(error=error, id=request_id)
+    ``McpServer.register_tool`` registers such handlers as they are, without
+    the wrapper that turns other exceptions into internal errors.
+    """
+    func._mcp_safe = True
+    return func
+
+
+# Pre-encoded envelopes for the fixed error responses; only the error data and
+# the request id are encoded per failure. Parse errors never have an id.
+_PARSE_ERROR_TEMPLATE = b'{"jsonrpc":"2.0","error":{"code":-32700,"message":"Parse error","data":%s},"id":null}'
+_INVALID_REQUEST_TEMPLATE = b'{"jsonrpc":"2.0","error":{"code":-32600,"message":"Invalid Request","data":%s},"id":%s}'
+_SERVICE_ERROR_TEMPLATE = b'{"jsonrpc":"2.0","error":{"code":-32000,"message":"Service error","data":%s},"id":%s}'
+_INTERNAL_ERROR_TEMPLATE = b'{"jsonrpc":"2.0","error":{"code":-32603,"message":"Internal error","data":%s},"id":%s}'
+
+# Success envelope around an already encoded result: result, id
+_RESULT_TEMPLATE = b'{"jsonrpc":"2.0","result":%s,"id":%s}'
+
+# Encoded result of mcp.ping, answered without going through the dispatcher
+_PONG = b'"pong"'
 
 
 class McpServer:
@@ -119,7 +172,27 @@ class McpServer:
         self._running = False
         self._shutdown_event = asyncio.Event()
         self._client = FastSearchClient(pipe_name=service_pipe)
+        # Every service client opened so far; start() adds more on demand
+        self._service_clients = [self._client]
+        # Idle service clients; created by start(), inside the running event loop
+        self._client_pool: Optional[asyncio.Queue] = None
+        # Created by start(), inside the running event loop
+        self._notification_queue: Optional[asyncio.Queue] = None
+        self._notification_workers: List[asyncio.Task] = []
+        # (signal, installed on the loop, previous handler) for each handler start() installed
+        self._installed_signals: List[tuple] = []
+        # Encoded responses for the single stdout writer; created by start()
+        self._output_queue: Optional[asyncio.Queue] = None
+        # mcp.get_capabilities result and the registry generation it was built for
+        self._capabilities_cache: Optional[Dict[str, Any]] = None
+        self._capabilities_generation = -1
+        # The same result encoded, spliced into responses without re-encoding it
+        self._capabilities_bytes: Optional[bytes] = None
+        # (time.monotonic() when taken, result) of the last fastsearch.status call
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         self._tool_registry = tool_registry or get_global_registry()
+        # The registry's live name -> tool dict, for dispatch without a method call
+        self._tools_by_name = self._tool_registry.tools
         
         # Register standard MCP methods
         self.register_tool("mcp.get_capabilities", self.handle_get_capabilities)
@@ -172,15 +245,20 @@ class McpServer:
         if not asyncio.iscoroutinefunction(handler):
             raise ValueError("Handler must be an async function")
             
+        # Handlers that only raise JsonRpcErrors don't need the error wrapper
+        if getattr(handler, '_mcp_safe', False):
+            self._tool_registry.register(handler, name=name)
+            return handler
+            
         # Wrap the handler to provide consistent error handling
         @wraps(handler)
-        async def wrapped_handler(**kwargs):
+        async def wrapped_handler(*args, **kwargs):
             try:
-                return await handler(**kwargs)
+                return await handler(*args, **kwargs)
             except JsonRpcError as e:
                 raise e
             except Exception as e:
-                logger.exception(f"Error in tool {name}")
+                logger.exception("Error in tool %s", name)
                 raise InternalError(str(e)) from e
                 
         # Register with the tool registry
@@ -199,70 +277,327 @@ class McpServer:
         
         # Set up signal handlers for graceful shutdown
         loop = asyncio.get_running_loop()
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, self._handle_shutdown_signal, sig)
+        self._install_signal_handlers(loop)
         
         stdin = stdin or sys.stdin
         stdout = stdout or sys.stdout
         
         logger.info("Starting FastSearch MCP server")
         
+        writer = read_transport = writer_task = write_executor = None
+        # Each request line is handled by its own task, so pipelined requests
+        # run concurrently and their responses are written as they complete
+        request_tasks: Set[asyncio.Task] = set()
+        request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        def request_done(task: asyncio.Task) -> None:
+            request_tasks.discard(task)
+            request_slots.release()
+        
+        self._client_pool = asyncio.Queue()
+        self._client_pool.put_nowait(self._client)
+        self._notification_queue = asyncio.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+        self._notification_workers = [
+            loop.create_task(self._run_notifications())
+            for _ in range(NOTIFICATION_WORKERS)
+        ]
         try:
             # Connect to the FastSearch service
             try:
                 await self._client.connect()
                 logger.info("Connected to FastSearch service")
             except IpcError as e:
-                logger.error(f"Failed to connect to FastSearch service: {e}")
+                logger.error("Failed to connect to FastSearch service: %s", e)
                 # Continue anyway to handle capabilities and other non-service methods
             
             # Main message loop
+            reader, writer, read_transport = await self._connect_stdio(loop, stdin, stdout)
+            write_blocking = None
+            if writer is None:
+                # Blocking writes get their own thread rather than competing
+                # with other users of the default executor
+                write_blocking = self._blocking_writer(stdout)
+                write_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="mcp-stdout"
+                )
+            if reader is None:
+                # One thread reads stdin for the whole run instead of an executor
+                # hop per line; raw bytes, as the JSON decoder takes them as they are
+                line_queue = asyncio.Queue(maxsize=INPUT_QUEUE_SIZE)
+                threading.Thread(
+                    target=self._read_lines_blocking,
+                    args=(loop, getattr(stdin, 'buffer', stdin).readline, line_queue),
+                    name="mcp-stdin-reader",
+                    daemon=True,
+                ).start()
+            self._output_queue = asyncio.Queue(maxsize=OUTPUT_QUEUE_SIZE)
+            writer_task = loop.create_task(
+                self._write_responses(loop, writer, write_blocking, write_executor)
+            )
             while self._running and not self._shutdown_event.is_set():
-                try:
-                    # Read a line from stdin
-                    line = await loop.run_in_executor(None, stdin.readline)
-                    if not line:
-                        logger.debug("Received EOF on stdin, shutting down")
-                        break
-                    
-                    # Process the request
-                    response = await self._process_request(line)
-                    if response:
-                        # Write the response to stdout
-                        await loop.run_in_executor(
-                            None, 
-                            lambda: stdout.write(json.dumps(response) + "\n") or stdout.flush()
-                        )
+                # Read a line from stdin
+                if reader is not None:
+                    line = await reader.readline()
+                else:
+                    line = await line_queue.get()
+                if not line:
+                    logger.debug("Received EOF on stdin, shutting down")
+                    break
                 
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON: {e}")
-                    response = JsonRpcResponse.error(
-                        -32700, "Parse error", str(e)
-                    )
-                    await loop.run_in_executor(
-                        None, 
-                        lambda: stdout.write(json.dumps(response.dict()) + "\n") or stdout.flush()
-                    )
-                
-                except Exception as e:
-                    logger.exception("Error processing request")
-                    response = JsonRpcResponse.error(
-                        -32603, "Internal error", str(e)
-                    )
-                    await loop.run_in_executor(
-                        None, 
-                        lambda: stdout.write(json.dumps(response.dict()) + "\n") or stdout.flush()
-                    )
+                await request_slots.acquire()
+                task = loop.create_task(self._handle_line(line))
+                request_tasks.add(task)
+                task.add_done_callback(request_done)
+            
+            # Finish the requests already in progress
+            if request_tasks:
+                await asyncio.gather(*request_tasks, return_exceptions=True)
         
         except asyncio.CancelledError:
             logger.info("Server task cancelled")
         
         finally:
             # Clean up
-            await self._client.disconnect()
+            for task in request_tasks:
+                task.cancel()
+            await asyncio.gather(*request_tasks, return_exceptions=True)
+            if writer_task is not None:
+                # Deliver responses that are already queued, e.g. the reply to
+                # mcp.shutdown, before the writer goes away
+                try:
+                    await asyncio.wait_for(self._output_queue.join(), OUTPUT_FLUSH_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning("Dropping responses that could not be written")
+                writer_task.cancel()
+                await asyncio.gather(writer_task, return_exceptions=True)
+                self._output_queue = None
+            if write_executor is not None:
+                write_executor.shutdown(wait=False)
+            for worker in self._notification_workers:
+                worker.cancel()
+            await asyncio.gather(*self._notification_workers, return_exceptions=True)
+            self._notification_workers = []
+            self._notification_queue = None
+            if writer is not None:
+                writer.close()
+            if read_transport is not None:
+                read_transport.close()
+            self._client_pool = None
+            for client in self._service_clients:
+                await client.disconnect()
+            del self._service_clients[1:]
+            self._remove_signal_handlers(loop)
             logger.info("FastSearch MCP server stopped")
     
-    async def _process_request(self, request_data: str) -> Optional[Dict[str, Any]]:
+    async def _handle_line(self, line: bytes) -> None:
+        """Process one request line and queue its response, if any."""
+        try:
+            response = await self._process_request(line)
+            if isinstance(response, bytes):
+                await self._write_payload(response + b"\n")
+            elif response:
+                # Queue the response for the stdout writer
+                await self._write_message(response)
+        
+        except (json.JSONDecodeError, ParseError) as e:
+            logger.error("Invalid JSON: %s", e)
+            await self._write_payload(
+                _PARSE_ERROR_TEMPLATE % _json_dumps(str(e)) + b"\n"
+            )
+        
+        except Exception as e:
+            logger.exception("Error processing request")
+            await self._write_payload(
+                _INTERNAL_ERROR_TEMPLATE % (_json_dumps(str(e)), b"null") + b"\n"
+            )
+    
+    async def _connect_stdio(self, loop: asyncio.AbstractEventLoop, stdin, stdout):
+        """Attach stdin and stdout to the event loop as buffered streams.
+        
+        The transports are built on duplicated file descriptors, so closing
+        them leaves ``sys.stdin`` and ``sys.stdout`` usable.
+        
+        Returns:
+            ``(reader, writer, read_transport)``, or ``(None, None, None)`` when
+            the loop can't drive these streams directly (e.g. redirected files,
+            or non-overlapped handles on the Windows proactor). The caller then
+            falls back to blocking reads and writes in the executor.
+        """
+        pipes = []
+        read_transport = None
+        try:
+            for stream, mode in ((stdin, 'rb'), (stdout, 'wb')):
+                pipes.append(os.fdopen(os.dup(stream.fileno()), mode, buffering=0))
+            
+            reader = asyncio.StreamReader(limit=MAX_MESSAGE_SIZE)
+            read_transport, _ = await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), pipes[0]
+            )
+            write_transport, write_protocol = await loop.connect_write_pipe(
+                asyncio.streams.FlowControlMixin, pipes[1]
+            )
+        except (AttributeError, NotImplementedError, OSError, ValueError) as e:
+            logger.debug("Using blocking stdio: %s", e)
+            if read_transport is not None:
+                read_transport.close()
+            else:
+                for pipe in pipes:
+                    pipe.close()
+            return None, None, None
+        
+        writer = asyncio.StreamWriter(write_transport, write_protocol, None, loop)
+        return reader, writer, read_transport
+    
+    @staticmethod
+    def _read_lines_blocking(loop: asyncio.AbstractEventLoop, readline: Callable[[], Any], queue: asyncio.Queue) -> None:
+        """Reader thread: put lines from ``readline`` on ``queue`` until EOF.
+        
+        Waits while the queue is full, so stdin is read no faster than the
+        server handles requests. An empty line marks EOF, including after a
+        read error. The thread can't be interrupted inside ``readline``; it is
+        a daemon so it never holds up interpreter exit.
+        """
+        def put(line) -> None:
+            asyncio.run_coroutine_threadsafe(queue.put(line), loop).result()
+        
+        try:
+            while True:
+                line = readline()
+                put(line)
+                if not line:
+                    return
+        except RuntimeError:  # The event loop has been closed
+            return
+        except Exception:
+            logger.exception("Error reading stdin")
+            try:
+                put(b"")
+            except RuntimeError:
+                pass
+    
+    @staticmethod
+    def _blocking_writer(stdout) -> Callable[[bytes], None]:
+        """Build the function that writes encoded messages to ``stdout`` from the executor.
+        
+        Bytes go straight to the binary buffer when the stream has one; the
+        text layer is flushed first so they stay ordered after anything
+        printed through it.
+        """
+        buffer = getattr(stdout, 'buffer', None)
+        if buffer is not None:
+            def write(data: bytes, _flush_text=stdout.flush, _write=buffer.write, _flush=buffer.flush) -> None:
+                _flush_text()
+                _write(data)
+                _flush()
+        else:
+            def write(data: bytes, _write=stdout.write, _flush=stdout.flush) -> None:
+                _write(data.decode('utf-8'))
+                _flush()
+        return write
+    
+    @contextlib.asynccontextmanager
+    async def _borrow_client(self) -> AsyncIterator[FastSearchClient]:
+        """Borrow an idle service connection from the pool for one call.
+        
+        When every client is busy, another one is added until there are
+        ``SERVICE_CONNECTIONS``; it connects on first use, as does a client
+        whose pipe has broken. Outside ``start()`` there is no pool and the
+        main client is used.
+        """
+        pool = self._client_pool
+        if pool is None:
+            yield self._client
+            return
+        if pool.empty() and len(self._service_clients) < SERVICE_CONNECTIONS:
+            client = FastSearchClient(pipe_name=self.service_pipe)
+            self._service_clients.append(client)
+        else:
+            client = await pool.get()
+        try:
+            yield client
+        finally:
+            pool.put_nowait(client)
+    
+    async def _write_message(self, message: Any) -> None:
+        """Queue one JSON message for the client."""
+        await self._write_payload(_json_dumps(message) + b"\n")
+    
+    async def _write_payload(self, data: bytes) -> None:
+        """Queue an already encoded, newline-terminated message for the client.
+        
+        Waits while the output queue is full, so a stalled client stops the
+        server from taking on more requests.
+        """
+        await self._output_queue.put(data)
+    
+    async def _write_responses(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        writer,
+        write_blocking,
+        write_executor: Optional[concurrent.futures.Executor] = None
+    ) -> None:
+        """Write queued messages to stdout until cancelled.
+        
+        This is the only coroutine that writes to stdout. Messages queued
+        while a write is in progress are joined and written together. Uses
+        ``writer`` when stdout is attached to the loop, otherwise runs
+        ``write_blocking`` in ``write_executor``.
+        """
+        queue = self._output_queue
+        while True:
+            chunks = [await queue.get()]
+            while not queue.empty():
+                chunks.append(queue.get_nowait())
+            data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+            try:
+                if writer is not None:
+                    writer.write(data)
+                    await writer.drain()
+                else:
+                    await loop.run_in_executor(write_executor, write_blocking, data)
+            except Exception:
+                logger.exception("Failed to write %d response(s) to stdout", len(chunks))
+            finally:
+                for _ in chunks:
+                    queue.task_done()
+    
+    async def serve(self, stdin=None, stdout=None) -> None:
+        """Run the server until its input closes or a shutdown is requested.
+        
+        ``start()`` may be blocked reading stdin when a shutdown is requested, so
+        the shutdown event is awaited alongside it and the server is cancelled
+        as soon as the event is set. Neither task outlives this call, and errors
+        from the message loop are re-raised.
+        
+        Args:
+            stdin: Input stream (default: sys.stdin)
+            stdout: Output stream (default: sys.stdout)
+        """
+        server_task = asyncio.ensure_future(self.start(stdin, stdout))
+        shutdown_task = asyncio.ensure_future(self._shutdown_event.wait())
+        try:
+            await asyncio.wait(
+                [server_task, shutdown_task],
+                return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            shutdown_task.cancel()
+            if not server_task.done():
+                server_task.cancel()
+            # Let both tasks finish unwinding before returning
+            await asyncio.gather(server_task, shutdown_task, return_exceptions=True)
+        
+        # Propagate errors from the message loop
+        if not server_task.cancelled():
+            server_task.result()
+    
+    async def stop(self) -> None:
+        """Request a graceful shutdown of the server."""
+        self._running = False
+        self._shutdown_event.set()
+    
+    async def _process_request(self, request_data: Union[str, bytes]) -> Union[Dict[str, Any], List[Any], bytes, None]:
         """
         Process a single JSON-RPC request or batch of requests.
         
@@ -270,7 +605,8 @@ class McpServer:
             request_data: Raw JSON-RPC request data
             
         Returns:
-            JSON-RPC response, or None for notifications
+            JSON-RPC response (already encoded as bytes if it carries a
+            pre-encoded result), or None for notifications
             
         Raises:
             JsonRpcError: For JSON-RPC specific errors
@@ -278,7 +614,7 @@ class McpServer:
         """
         try:
             try:
-                request = json.loads(request_data)
+                request = _json_loads(request_data)
             except json.JSONDecodeError as e:
                 raise ParseError(f"Invalid JSON: {e}")
                 
@@ -287,26 +623,47 @@ class McpServer:
                 if not request:  # Empty batch
                     raise InvalidRequest("Empty batch request")
                     
-                # Process each request in the batch
+                # Batch members are independent, so run them concurrently
+                results = await asyncio.gather(
+                    *[self._process_single_request(req) for req in request],
+                    return_exceptions=True
+                )
+
                 responses = []
-                for req in request:
-                    try:
-                        response = await self._process_single_request(req)
-                        if response is not None:  # Skip notifications
-                            responses.append(response)
-                    except JsonRpcError as e:
+                for req, result in zip(request, results):
+                    if isinstance(result, JsonRpcError):
                         responses.append({
                             "jsonrpc": "2.0",
                             "error": {
-                                "code": e.code,
-                                "message": e.message,
-                                "data": e.data
+                                "code": result.code,
+                                "message": result.message,
+                                "data": result.data
                             },
                             "id": req.get('id') if isinstance(req, dict) else None
                         })
-                        
+                    elif isinstance(result, BaseException):
+                        raise result
+                    elif result is not None:  # Skip notifications
+                        responses.append(result)
+
+                if any(isinstance(response, bytes) for response in responses):
+                    # Some members are already encoded; encode the rest and join them
+                    return b"[" + b",".join(
+                        response if isinstance(response, bytes) else _json_dumps(response)
+                        for response in responses
+                    ) + b"]"
                 return responses if responses else None
                 
+            # Liveness probes are frequent and always answer the same, so a
+            # well-formed ping skips validation and dispatch
+            if (
+                isinstance(request, dict)
+                and request.get('method') == "mcp.ping"
+                and request.get('jsonrpc') == "2.0"
+                and request.get('id') is not None
+            ):
+                return _RESULT_TEMPLATE % (_PONG, _json_dumps(request['id']))
+            
             return await self._process_single_request(request)
             
         except JsonRpcError as e:
@@ -317,7 +674,7 @@ class McpServer:
             logger.exception("Unexpected error processing request")
             raise InternalError(f"Internal error: {str(e)}") from e
     
-    async def _process_single_request(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def _process_single_request(self, request: Dict[str, Any]) -> Union[Dict[str, Any], bytes, None]:
         """
         Process a single JSON-RPC request.
         
@@ -325,57 +682,87 @@ class McpServer:
             request: The JSON-RPC request
             
         Returns:
-            JSON-RPC response, or None for notifications
+            JSON-RPC response (already encoded as bytes if it carries a
+            pre-encoded result), or None for notifications
             
         Raises:
             JsonRpcError: For JSON-RPC specific errors
             Exception: For other unexpected errors
         """
         try:
-            # Parse the request
-            try:
-                request_dict = request
-                request = JsonRpcRequest(**request_dict)
-            except Exception as e:
-                logger.error(f"Invalid request: {e}")
-                return JsonRpcResponse.error(
-                    -32600, "Invalid Request", str(e)
+            # Validate the envelope by hand; building a JsonRpcRequest model per
+            # call costs more than most of the handlers it dispatches to
+            if not isinstance(request, dict):
+                return _INVALID_REQUEST_TEMPLATE % (b'"Request must be an object"', b"null")
+            method = request.get('method')
+            params = request.get('params')
+            request_id = request.get('id')
+            if request.get('jsonrpc') != "2.0":
+                return _INVALID_REQUEST_TEMPLATE % (
+                    b"\"jsonrpc version must be '2.0'\"", _json_dumps(request_id)
+                )
+            if not isinstance(method, str):
+                return _INVALID_REQUEST_TEMPLATE % (
+                    b'"method must be a string"', _json_dumps(request_id)
+                )
+            if params is not None and not isinstance(params, (dict, list)):
+                return _INVALID_REQUEST_TEMPLATE % (
+                    b'"params must be an object or array"', _json_dumps(request_id)
                 )
             
             # Handle notifications (requests without an ID)
-            if request.id is None:
-                logger.debug(f"Received notification: {request.method}")
-                asyncio.create_task(self._execute_handler(request))
+            if request_id is None:
+                logger.debug("Received notification: %s", method)
+                if self._notification_queue is not None:
+                    # Blocks while the queue is full, which stops reading stdin
+                    await self._notification_queue.put((method, params))
+                else:
+                    await self._run_notification(method, params)
                 return None
             
             # Handle regular requests
-            logger.debug(f"Received request: {request.method} (id: {request.id})")
+            logger.debug("Received request: %s (id: %s)", method, request_id)
             try:
-                result = await self._execute_handler(request)
-                return JsonRpcResponse.success(result, request.id)
+                result = await self._execute_handler(method, params)
+                if result is self._capabilities_cache and self._capabilities_bytes is not None:
+                    # Capabilities rarely change; reuse their encoding
+                    return _RESULT_TEMPLATE % (self._capabilities_bytes, _json_dumps(request_id))
+                return {"jsonrpc": "2.0", "result": result, "id": request_id}
             
             except Exception as e:
-                logger.exception(f"Error handling {request.method}")
+                logger.exception("Error handling %s", method)
                 if isinstance(e, IpcError):
-                    return JsonRpcResponse.error(
-                        -32000, "Service error", str(e), request.id
-                    )
-                return JsonRpcResponse.error(
-                    -32603, "Internal error", str(e), request.id
-                )
+                    return _SERVICE_ERROR_TEMPLATE % (_json_dumps(str(e)), _json_dumps(request_id))
+                return _INTERNAL_ERROR_TEMPLATE % (_json_dumps(str(e)), _json_dumps(request_id))
         
         except Exception as e:
             logger.exception("Unexpected error processing request")
-            return JsonRpcResponse.error(
-                -32603, "Internal error", str(e)
-            )
+            return _INTERNAL_ERROR_TEMPLATE % (_json_dumps(str(e)), b"null")
+    
+    async def _run_notifications(self) -> None:
+        """Worker that runs queued notification handlers until cancelled."""
+        queue = self._notification_queue
+        while True:
+            method, params = await queue.get()
+            try:
+                await self._run_notification(method, params)
+            finally:
+                queue.task_done()
     
-    async def _execute_handler(self, request: JsonRpcRequest) -> Any:
+    async def _run_notification(self, method: str, params: JsonRpcParams) -> None:
+        """Run a notification handler; there is nobody to report errors to."""
+        try:
+            await self._execute_handler(method, params)
+        except Exception:
+            logger.exception("Error handling notification %s", method)
+    
+    async def _execute_handler(self, method: str, params: JsonRpcParams) -> Any:
         """
         Execute the appropriate handler for a request.
         
         Args:
-            request: The JSON-RPC request
+            method: The requested method
+            params: The request's params
             
         Returns:
             The handler's result
@@ -383,24 +770,60 @@ class McpServer:
         Raises:
             Exception: If the handler raises an exception
         """
-        handler = self._tool_registry.get_tool(request.method)
-        if not handler:
-            raise MethodNotFound(request.method)
-        
-        # Convert params to kwargs if it's a dict
-        params = request.params or {}
-        if isinstance(params, dict):
-            return await handler(**params)
-        else:
-            return await handler(*params)
+        tool = self._tools_by_name.get(method)
+        if not tool:
+            raise MethodNotFound(method)
+        
+        # Parameterless handlers such as mcp.ping skip params handling entirely
+        if tool.zero_arg and not params:
+            return await tool.handler()
+        # Named params become kwargs, positional params become args
+        return await tool.invoke(params)
+    
+    def _install_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Route SIGINT and SIGTERM to a graceful shutdown.
+        
+        The Windows proactor loop doesn't support ``add_signal_handler``, so
+        there the handlers are installed with ``signal.signal`` and pass the
+        shutdown to the event loop thread-safely. Nothing is installed when
+        the server doesn't run in the main thread, or when the handlers are
+        already in place. ``_remove_signal_handlers`` undoes this.
+        """
+        if self._installed_signals:
+            return
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                try:
+                    loop.add_signal_handler(sig, self._handle_shutdown_signal, sig)
+                    self._installed_signals.append((sig, True, None))
+                except NotImplementedError:
+                    previous = signal.signal(
+                        sig,
+                        lambda signum, frame: loop.call_soon_threadsafe(
+                            self._handle_shutdown_signal, signum
+                        )
+                    )
+                    self._installed_signals.append((sig, False, previous))
+            except (ValueError, RuntimeError) as e:  # Not the main thread
+                logger.debug("Not handling signal %s: %s", sig, e)
+    
+    def _remove_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Remove the handlers installed by ``_install_signal_handlers``."""
+        for sig, on_loop, previous in self._installed_signals:
+            if on_loop:
+                loop.remove_signal_handler(sig)
+            else:
+                signal.signal(sig, previous if previous is not None else signal.SIG_DFL)
+        self._installed_signals = []
     
     def _handle_shutdown_signal(self, signum, frame=None):
         """Handle shutdown signals."""
-        logger.info(f"Received signal {signum}, shutting down...")
+        logger.info("Received signal %s, shutting down...", signum)
         self._shutdown_event.set()
     
     # Standard MCP method handlers
     
+    @_mcp_safe
     @tool_decorator("mcp.get_capabilities", "Get server capabilities and available tools")
     async def handle_get_capabilities(self) -> Dict[str, Any]:
         """
@@ -409,16 +832,22 @@ class McpServer:
         Returns:
             Dictionary containing server capabilities and available tools
         """
-        tools = []
-        for tool_info in self._tool_registry.list_tools():
-            tools.append({
+        # Tools rarely change after startup, so rebuild only after a registration
+        generation = self._tool_registry.generation
+        if self._capabilities_generation == generation:
+            return self._capabilities_cache
+        
+        tools = [
+            {
                 'name': tool_info.name,
                 'description': tool_info.description or "",
                 'parameters': tool_info.parameters,
                 'returns': tool_info.returns
-            })
+            }
+            for tool_info in self._tool_registry.snapshot
+        ]
             
-        return {
+        self._capabilities_cache = {
             "version": "2.11.3",
             "capabilities": {
                 "fastsearch": {
@@ -427,7 +856,11 @@ class McpServer:
                 }
             }
         }
+        self._capabilities_bytes = _json_dumps(self._capabilities_cache)
+        self._capabilities_generation = generation
+        return self._capabilities_cache
     
+    @_mcp_safe
     @tool_decorator("mcp.ping", "Simple ping/pong for health checking")
     async def handle_ping(self) -> str:
         """
@@ -438,6 +871,7 @@ class McpServer:
         """
         return "pong"
     
+    @_mcp_safe
     @tool_decorator("mcp.shutdown", "Gracefully shut down the server")
     async def handle_shutdown(self) -> None:
         """
@@ -488,23 +922,30 @@ class McpServer:
         if not query or not isinstance(query, str):
             raise InvalidParams("Query must be a non-empty string")
             
-        if search_type not in ["fuzzy", "exact", "regex", "glob"]:
+        if not isinstance(search_type, str) or search_type not in _VALID_SEARCH_TYPES:
             raise InvalidParams("search_type must be one of: fuzzy, exact, regex, glob")
             
-        if not isinstance(max_results, int) or max_results < 1 or max_results > 1000:
+        # type() rather than isinstance() so JSON booleans aren't taken as 0/1
+        if type(max_results) is not int or max_results not in _MAX_RESULTS_RANGE:
             raise InvalidParams("max_results must be an integer between 1 and 1000")
             
         try:
-            return await self._client.search(
-                query=query,
-                search_type=search_type,
-                max_results=max_results,
-                **filters
-            )
+            async with self._borrow_client() as client:
+                results = await client.search(
+                    query=query,
+                    search_type=search_type,
+                    max_results=max_results,
+                    **filters
+                )
         except IpcError as e:
-            logger.error(f"Search failed: {e}")
+            logger.error("Search failed: %s", e)
             raise InternalError(f"Search failed: {e}") from e
+        
+        # The service just answered, so a cached status may be out of date
+        self._status_cache = None
+        return results
     
+    @_mcp_safe
     @tool_decorator("fastsearch.status", "Get the current status of the FastSearch service")
     async def handle_status(self) -> Dict[str, Any]:
         """
@@ -516,15 +957,21 @@ class McpServer:
         Raises:
             InternalError: If the status check fails
         """
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and now - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+        
         try:
-            status = await self._client.get_status()
-            return {
+            async with self._borrow_client() as client:
+                status = await client.get_status()
+            result = {
                 "service_available": True,
                 "service_status": status,
                 "bridge_status": "ready"
             }
         except IpcError as e:
-            return {
+            result = {
                 "service_available": False,
                 "service_status": {
                     "running": False,
@@ -532,3 +979,5 @@ class McpServer:
                 },
                 "bridge_status": "ready"
             }
+        self._status_cache = (now, result)
+        return result
@@ -0,0 +1,47 @@
+"""
+Search and status message types for the FastSearch MCP Bridge.
+
+Kept out of the server modules so the pydantic model is only built by code
+that imports it.
+"""
+
+from typing import Any, Dict, List, Optional, TypedDict
+
+from pydantic import BaseModel, Field
+
+
+class SearchRequest(BaseModel):
+    """Search request model."""
+    
+    pattern: str = Field(..., description="Search pattern")
+    search_type: str = Field("fuzzy", description="Type of search (exact, glob, regex, fuzzy)")
+    max_results: int = Field(50, description="Maximum number of results to return")
+    filters: Optional[Dict[str, Any]] = Field(None, description="Additional search filters")
+
+
+# Responses are built as plain dicts on every request, so they are typed with
+# TypedDicts rather than validated models that would only be turned back into dicts
+class SearchResult(TypedDict):
+    """Search result."""
+    
+    path: str  # File path
+    score: Optional[float]  # Search relevance score
+    size: Optional[int]  # File size in bytes
+    modified: Optional[float]  # Last modified timestamp
+    is_dir: bool  # Whether the path is a directory
+
+
+class SearchResponse(TypedDict):
+    """Search response."""
+    
+    results: List[SearchResult]  # List of search results
+    total: int  # Total number of results
+    duration_ms: float  # Search duration in milliseconds
+
+
+class ServiceStatus(TypedDict):
+    """Service status."""
+    
+    running: bool  # Whether the service is running
+    version: Optional[str]  # Service version
+    uptime_seconds: Optional[float]  # Service uptime in seconds
@@ -5,13 +5,52 @@ This package contains tools that can be registered with the MCP server.
 Each tool is a Python function that can be called remotely via the MCP protocol.
 """
 
-from typing import Dict, List, Any, Optional, Callable, Awaitable
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable, Awaitable, Mapping, Tuple, Union
+from dataclasses import dataclass, field
 from functools import wraps
 import inspect
 import json
+import weakref
 
 ToolHandler = Callable[..., Awaitable[Any]]
+ToolInvoker = Callable[[Union[Dict[str, Any], List[Any], None]], Awaitable[Any]]
+
+# How to call each handler, so a function registered more than once (or
+# under several names) is only inspected once
+_call_specs: 'weakref.WeakKeyDictionary[ToolHandler, Tuple[ToolInvoker, bool]]' = weakref.WeakKeyDictionary()
+
+def _make_call_spec(handler: ToolHandler) -> Tuple[ToolInvoker, bool]:
+    """Work out how to call ``handler`` with JSON-RPC params.
+    
+    Returns:
+        A callable that applies params to the handler (named params as
+        keyword arguments, positional params as positional ones), and
+        whether the handler takes no parameters at all.
+    """
+    try:
+        zero_arg = not inspect.signature(handler).parameters
+    except (TypeError, ValueError):
+        zero_arg = False
+    
+    if zero_arg:
+        def invoke(params):
+            return handler(**params) if params else handler()
+    else:
+        def invoke(params):
+            if isinstance(params, dict):
+                return handler(**params)
+            return handler(*(params or ()))
+    return invoke, zero_arg
+
+def get_call_spec(handler: ToolHandler) -> Tuple[ToolInvoker, bool]:
+    """Get the cached ``(invoker, zero_arg)`` pair for a tool handler."""
+    try:
+        spec = _call_specs.get(handler)
+    except TypeError:  # Not weak-referenceable; build it uncached
+        return _make_call_spec(handler)
+    if spec is None:
+        spec = _call_specs[handler] = _make_call_spec(handler)
+    return spec
 
 @dataclass
 class ToolInfo:
@@ -21,6 +60,41 @@ class ToolInfo:
     description: str
     parameters: dict
     returns: dict
+    # Calls the handler with a request's params; resolved once at registration
+    invoke: ToolInvoker = field(init=False, repr=False, compare=False)
+    # The handler takes no parameters, so it can be called without params
+    zero_arg: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.invoke, self.zero_arg = get_call_spec(self.handler)
+
+def _describe(func: Callable, name: str, description: str = "") -> dict:
+    """Build the tool metadata for a function from its signature."""
+    # Extract parameter information
+    sig = inspect.signature(func)
+    parameters = {}
+    
+    for param in sig.parameters.values():
+        param_info = {
+            'type': param.annotation.__name__ if param.annotation != inspect.Parameter.empty else 'Any',
+            'default': str(param.default) if param.default != inspect.Parameter.empty else None,
+            'required': param.default == inspect.Parameter.empty,
+        }
+        if param.annotation != inspect.Parameter.empty:
+            param_info['type'] = param.annotation.__name__
+        parameters[param.name] = param_info
+    
+    # Get return type info
+    return_type = 'Any'
+    if sig.return_annotation != inspect.Signature.empty:
+        return_type = sig.return_annotation.__name__
+    
+    return {
+        'name': name,
+        'description': description or func.__doc__ or "",
+        'parameters': parameters,
+        'returns': {'type': return_type}
+    }
 
 def tool(name: str, description: str = ""):
     """
@@ -31,32 +105,8 @@ def tool(name: str, description: str = ""):
         description: A short description of what the tool does
     """
     def decorator(func):
-        # Extract parameter information
-        sig = inspect.signature(func)
-        parameters = {}
-        
-        for param in sig.parameters.values():
-            param_info = {
-                'type': param.annotation.__name__ if param.annotation != inspect.Parameter.empty else 'Any',
-                'default': str(param.default) if param.default != inspect.Parameter.empty else None,
-                'required': param.default == inspect.Parameter.empty,
-            }
-            if param.annotation != inspect.Parameter.empty:
-                param_info['type'] = param.annotation.__name__
-            parameters[param.name] = param_info
-        
-        # Get return type info
-        return_type = 'Any'
-        if sig.return_annotation != inspect.Signature.empty:
-            return_type = sig.return_annotation.__name__
-        
         # Store metadata
-        func._mcp_tool = {
-            'name': name,
-            'description': description or func.__doc__ or "",
-            'parameters': parameters,
-            'returns': {'type': return_type}
-        }
+        func._mcp_tool = _describe(func, name, description)
         
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -70,20 +120,52 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: Dict[str, ToolInfo] = {}
+        # Bumped on every registration so callers can cache derived data
+        self.generation = 0
+        self._snapshot: Optional[Tuple[ToolInfo, ...]] = None
     
-    def register(self, func: ToolHandler) -> None:
-        """Register a tool function."""
-        if not hasattr(func, '_mcp_tool'):
+    def register(self, func: ToolHandler, name: Optional[str] = None) -> None:
+        """Register a tool function.
+        
+        Args:
+            func: A function decorated with @tool, or any async function if
+                ``name`` is given.
+            name: Register the function under this name instead of the one
+                given to @tool.
+        """
+        if hasattr(func, '_mcp_tool'):
+            meta = func._mcp_tool
+        elif name is not None:
+            meta = _describe(func, name)
+        else:
             raise ValueError("Function must be decorated with @tool")
             
-        meta = func._mcp_tool
-        self._tools[meta['name']] = ToolInfo(
-            name=meta['name'],
+        name = name or meta['name']
+        self._tools[name] = ToolInfo(
+            name=name,
             handler=func,
             description=meta['description'],
             parameters=meta['parameters'],
             returns=meta['returns']
         )
+        self.generation += 1
+        self._snapshot = None
+    
+    @property
+    def tools(self) -> Mapping[str, ToolInfo]:
+        """Registered tools by name.
+        
+        This is the registry's own dict, not a copy, so it stays current as
+        tools are registered; treat it as read-only.
+        """
+        return self._tools
+    
+    @property
+    def snapshot(self) -> Tuple[ToolInfo, ...]:
+        """All registered tools, as a tuple that is rebuilt only after a registration."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self._tools.values())
+        return self._snapshot
     
     def get_tool(self, name: str) -> Optional[ToolInfo]:
         """Get a tool by name."""
@@ -98,7 +180,7 @@ class ToolRegistry:
                 'parameters': tool.parameters,
                 'returns': tool.returns
             }
-            for tool in self._tools.values()
+            for tool in self.snapshot
         ]
     
     async def execute(self, tool_name: str, **kwargs) -> Any:
@@ -94,6 +94,9 @@ class ToolRegistry:
     """Registry for all available tools."""
     _instance = None
     _tools: Dict[str, BaseTool] = {}
+    # Definition dicts and parameter schemas, built once when a tool registers
+    _definitions: Dict[str, Dict[str, Any]] = {}
+    _schemas: Dict[str, Dict[str, Any]] = {}
     
     def __new__(cls):
         if cls._instance is None:
@@ -107,6 +110,8 @@ class ToolRegistry:
         if definition.name in cls._tools:
             logger.warning("Tool %s is already registered. Overwriting.", definition.name)
         cls._tools[definition.name] = tool
+        cls._definitions[definition.name] = definition.to_dict()
+        cls._schemas[definition.name] = _build_schema(definition)
         logger.debug("Registered tool: %s", definition.name)
     
     @classmethod
@@ -117,42 +122,39 @@ class ToolRegistry:
     @classmethod
     def list_tools(cls) -> Dict[str, Dict[str, Any]]:
         """List all registered tools with their definitions."""
-        return {
-            name: tool.get_definition().to_dict()
-            for name, tool in cls._tools.items()
-        }
+        return dict(cls._definitions)
     
     @classmethod
     def get_tool_schema(cls, name: str) -> Optional[Dict[str, Any]]:
         """Get the JSON schema for a tool's parameters."""
-        tool = cls.get_tool(name)
-        if not tool:
-            return None
+        return cls._schemas.get(name)
+
+
+def _build_schema(definition: ToolDefinition) -> Dict[str, Any]:
+    """Build the JSON schema for a tool definition's parameters."""
+    schema = {
+        'type': 'object',
+        'properties': {},
+        'required': [],
+        'additionalProperties': False
+    }
+    
+    for param in definition.parameters:
+        param_schema = {'type': param.type.__name__.lower()}
+        if param.choices:
+            param_schema['enum'] = param.choices
+        if param.min is not None:
+            param_schema['minimum'] = param.min
+        if param.max is not None:
+            param_schema['maximum'] = param.max
+        if not param.required:
+            param_schema['default'] = param.default
             
-        definition = tool.get_definition()
-        schema = {
-            'type': 'object',
-            'properties': {},
-            'required': [],
-            'additionalProperties': False
-        }
-        
-        for param in definition.parameters:
-            param_schema = {'type': param.type.__name__.lower()}
-            if param.choices:
-                param_schema['enum'] = param.choices
-            if param.min is not None:
-                param_schema['minimum'] = param.min
-            if param.max is not None:
-                param_schema['maximum'] = param.max
-            if not param.required:
-                param_schema['default'] = param.default
-                
-            schema['properties'][param.name] = param_schema
-            if param.required:
-                schema['required'].append(param.name)
-                
-        return schema
+        schema['properties'][param.name] = param_schema
+        if param.required:
+            schema['required'].append(param.name)
+            
+    return schema
 
 
 def tool(
@@ -1,13 +1,16 @@
 """Disk space analyzer tool for MCP."""
 import asyncio
+import heapq
+import itertools
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 from fastsearch_mcp.tools.base import BaseTool, ToolCategory, ToolParameter, tool
 from fastsearch_mcp.logging_config import get_logger
+from fastsearch_mcp.utils.file_utils import WALK_WORKERS, scan_sizes
 
 logger = get_logger(__name__)
 
@@ -41,87 +44,167 @@ class DiskUsage:
         return f"{size:.{decimal_places}f} {unit}"
 
 
-def get_disk_usage(path: Union[str, Path], max_depth: int = 3) -> DiskUsage:
-    """Get disk usage information for a directory."""
-    path = Path(path).resolve()
-    usage = DiskUsage(path=str(path), size=0)
+def _scan_directory(
+    path: str,
+    owner: DiskUsage,
+    depth: int,
+    max_depth: Optional[int]
+) -> List[Tuple[str, Optional[DiskUsage]]]:
+    """Add the files directly in ``path``, which is at ``depth``, to ``owner``.
+    
+    ``owner`` is the usage entry for ``path`` itself or, past ``max_depth``,
+    for its deepest ancestor that has one. Every subdirectory is counted in
+    ``owner.dir_count``.
     
+    Returns:
+        ``(path, usage)`` for each subdirectory. Subdirectories within
+        ``max_depth`` get a usage entry linked into ``owner.children``, with
+        its totals not yet filled in; deeper ones get None. A ``max_depth``
+        of None is no limit.
+    """
+    subdirs = []
     try:
-        for entry in os.scandir(path):
-            try:
-                if entry.is_symlink():
-                    continue
-                    
-                if entry.is_file():
-                    usage.file_count += 1
-                    usage.size += entry.stat().st_size
-                    
-                elif entry.is_dir():
-                    if max_depth > 0:
-                        child_usage = get_disk_usage(entry.path, max_depth - 1)
-                        usage.dir_count += 1 + child_usage.dir_count
-                        usage.file_count += child_usage.file_count
-                        usage.size += child_usage.size
-                        usage.children.append(child_usage)
-                    else:
-                        # Just count the directory without recursing
-                        usage.dir_count += 1
-                        # Estimate size using shutil.disk_usage for performance
-                        try:
-                            du = shutil.disk_usage(entry.path)
-                            usage.size += du.used
-                        except (OSError, PermissionError):
-                            pass
-                            
-            except (PermissionError, OSError) as e:
-                logger.debug("Error accessing %s: %s", entry.path, e)
-                continue
+        # Only files need a size; directories are classified from the listing
+        for entry_path, kind, size in scan_sizes(path):
+            if kind == 'file':
+                owner.file_count += 1
+                owner.size += size
                 
+            elif kind == 'dir':
+                owner.dir_count += 1
+                child = None
+                if max_depth is None or depth < max_depth:
+                    child = DiskUsage(path=entry_path, size=0)
+                    owner.children.append(child)
+                subdirs.append((entry_path, child))
+                    
     except (PermissionError, OSError) as e:
         logger.warning("Error scanning directory %s: %s", path, e)
-        
-    return usage
+    return subdirs
 
 
-def get_largest_files(path: Union[str, Path], limit: int = 50) -> List[Dict]:
-    """Get the largest files in a directory."""
+def _walk_usage(top: DiskUsage, depth: int, max_depth: Optional[int]) -> DiskUsage:
+    """Fill in the totals for the tree under ``top``, which is at ``depth``.
+    
+    Directories past ``max_depth`` get no usage entry of their own; their
+    totals go straight to their deepest ancestor that has one.
+    """
+    # (usage, parent usage) for every entry below top, parents before their children
+    visited: List[Tuple[DiskUsage, DiskUsage]] = []
+    stack: List[Tuple[str, DiskUsage, int]] = [(top.path, top, depth)]
+    while stack:
+        path, owner, depth = stack.pop()
+        for subdir, child in _scan_directory(path, owner, depth, max_depth):
+            if child is not None:
+                visited.append((child, owner))
+                stack.append((subdir, child, depth + 1))
+            else:
+                stack.append((subdir, owner, depth + 1))
+    
+    # Children were visited after their parents, so folding in reverse
+    # order adds each subtree's totals in before its parent is folded
+    for usage, parent in reversed(visited):
+        _add_subtree(parent, usage)
+    return top
+
+
+def _add_subtree(parent: DiskUsage, child: DiskUsage) -> None:
+    """Add the totals below ``child``, which ``parent`` already counts, to ``parent``."""
+    parent.dir_count += child.dir_count
+    parent.file_count += child.file_count
+    parent.size += child.size
+
+
+def get_disk_usage(path: Union[str, Path], max_depth: Optional[int] = 3) -> DiskUsage:
+    """Get disk usage information for a directory.
+    
+    The whole tree is walked iteratively with one directory listing per
+    directory, so sizes and counts are always complete; ``max_depth`` only
+    limits how deep the returned ``children`` tree goes, and no usage entries
+    are built below it. The cost is therefore that of a full walk even for a
+    shallow ``max_depth``; 0 or None builds the ``children`` tree for every
+    directory. The subtrees of the top-level directories are walked in
+    parallel threads.
+    """
+    if not max_depth:
+        max_depth = None
     path = Path(path).resolve()
-    largest = []
+    root = DiskUsage(path=str(path), size=0)
+    
+    def walk_subdir(subdir: Tuple[str, Optional[DiskUsage]]) -> DiskUsage:
+        subdir_path, usage = subdir
+        if usage is None:
+            # Only collects totals for the root; it isn't linked as a child
+            usage = DiskUsage(path=subdir_path, size=0)
+        return _walk_usage(usage, 1, max_depth)
     
-    def scan_dir(directory: Path):
+    subdirs = _scan_directory(str(path), root, 0, max_depth)
+    # Each thread only touches the entries of its own subtree
+    with ThreadPoolExecutor(max_workers=min(WALK_WORKERS, len(subdirs) or 1)) as pool:
+        for usage in pool.map(walk_subdir, subdirs):
+            _add_subtree(root, usage)
+        
+    return root
+
+
+def _collect_largest(
+    directory: str,
+    limit: int,
+    heap: List[Tuple[int, str]],
+    subdirs: Optional[List[str]] = None
+) -> None:
+    """Add the files under ``directory`` to ``heap``.
+    
+    ``heap`` is a min-heap of ``(size, path)`` that keeps only the ``limit``
+    largest files. With ``subdirs`` given, subdirectories are appended to it
+    instead of being scanned.
+    """
+    pending = [directory]
+    while pending:
+        current = pending.pop()
         try:
-            for entry in directory.iterdir():
-                try:
-                    if entry.is_symlink():
-                        continue
-                        
-                    if entry.is_file():
-                        stat = entry.stat()
-                        largest.append((entry, stat.st_size))
-                        # Keep only the largest files
-                        largest.sort(key=lambda x: x[1], reverse=True)
-                        if len(largest) > limit * 2:  # Keep some extra to avoid frequent resizing
-                            largest.pop()
-                            
-                    elif entry.is_dir():
-                        scan_dir(entry)
+            for entry_path, kind, size in scan_sizes(current):
+                if kind == 'file':
+                    if len(heap) < limit:
+                        heapq.heappush(heap, (size, entry_path))
+                    elif heap and size > heap[0][0]:
+                        heapq.heapreplace(heap, (size, entry_path))
                         
-                except (PermissionError, OSError):
-                    continue
+                elif kind == 'dir':
+                    (subdirs if subdirs is not None else pending).append(entry_path)
                     
         except (PermissionError, OSError):
             pass
+
+
+def get_largest_files(path: Union[str, Path], limit: int = 50) -> List[Dict]:
+    """Get the largest files in a directory.
+    
+    The top-level directories are scanned in parallel threads.
+    """
+    path = Path(path).resolve()
+    largest = []
+    
+    def scan_subdir(directory: str) -> List[Tuple[int, str]]:
+        heap = []
+        _collect_largest(directory, limit, heap)
+        return heap
     
     try:
-        scan_dir(path)
+        heap = []
+        subdirs = []
+        _collect_largest(str(path), limit, heap, subdirs)
+        with ThreadPoolExecutor(max_workers=min(WALK_WORKERS, len(subdirs) or 1)) as pool:
+            found = list(pool.map(scan_subdir, subdirs))
+        largest = heapq.nlargest(limit, itertools.chain(heap, *found))
     except Exception as e:
         logger.warning("Error finding largest files in %s: %s", path, e)
     
     return [{
-        'path': str(file.relative_to(path)),
+        'path': os.path.relpath(file, path),
         'size': size,
         'size_human': f"{size / (1024 * 1024):.2f} MB"
-    } for file, size in largest[:limit]]
+    } for size, file in largest]
 
 
 def get_disk_partitions() -> List[Dict]:
@@ -153,7 +236,11 @@ def get_disk_partitions() -> List[Dict]:
 
 @tool(
     name="analyze_disk_usage",
-    description="Analyze disk usage and find large files and directories",
+    description=(
+        "Analyze disk usage and find large files and directories. Sizes and "
+        "counts always cover the whole tree under the path, so analyzing a "
+        "volume root walks the entire volume however small max_depth is"
+    ),
     category=ToolCategory.SYSTEM,
     parameters=[
         ToolParameter(
@@ -166,7 +253,10 @@ def get_disk_partitions() -> List[Dict]:
         ToolParameter(
             name="max_depth",
             type=int,
-            description="Maximum depth to analyze (0 for unlimited)",
+            description=(
+                "Maximum depth of the directory breakdown (0 for unlimited); "
+                "does not limit the walk itself"
+            ),
             default=3,
             min=0,
             max=10
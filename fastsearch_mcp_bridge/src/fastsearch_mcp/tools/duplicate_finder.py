@@ -1,20 +1,98 @@
 """Duplicate file finder tool for MCP."""
 import asyncio
 import hashlib
+import mmap
 import os
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 from fastsearch_mcp.tools.base import BaseTool, ToolCategory, ToolParameter, tool
 from fastsearch_mcp.logging_config import get_logger
-from fastsearch_mcp.utils.file_utils import find_files, is_binary_file
+from fastsearch_mcp.utils.file_utils import WALK_WORKERS, compile_globs, find_file_stats, is_binary_file
 
 logger = get_logger(__name__)
 
 # Chunk size for reading files (1MB)
 CHUNK_SIZE = 1024 * 1024
 
+# Bytes compared before same-size files are hashed in full
+HEAD_SIZE = 4096
+
+# Files larger than this are hashed from a memory map rather than read in chunks
+MMAP_THRESHOLD = 4 * CHUNK_SIZE
+
+# Default limit on the bytes read for full-content hashing in one search (10GB)
+MAX_HASH_BYTES = 10 * 1024 ** 3
+
+# Per-thread read buffer for the fast_check hash, reused across files
+_buffers = threading.local()
+
+# Hashes only group files that already have the same size within one run, so
+# the fastest available hash is used; blake3 hashes with SIMD and threads
+try:
+    import blake3
+
+    def _new_hasher():
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+
+    if hasattr(blake3.blake3, 'update_mmap'):
+        def _hash_whole_file(file_path: Path, file_size: int) -> str:
+            # Hashes a memory map of the file, without a Python read loop
+            hasher = _new_hasher()
+            hasher.update_mmap(file_path)
+            return hasher.hexdigest()
+    else:  # blake3 releases before update_mmap
+        def _hash_whole_file(file_path: Path, file_size: int) -> str:
+            hasher = _new_hasher()
+            with open(file_path, 'rb') as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
+except ImportError:  # blake3 is an optional speedup
+    def _new_hasher():
+        return hashlib.blake2b(digest_size=16)
+
+    if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+        def _hash_read(file_path: Path) -> str:
+            # Reads into one reused buffer instead of a new bytes object per chunk
+            with open(file_path, 'rb') as f:
+                return hashlib.file_digest(f, _new_hasher).hexdigest()
+    else:
+        def _hash_read(file_path: Path) -> str:
+            hasher = _new_hasher()
+            with open(file_path, 'rb') as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
+
+    def _hash_mapped(file_path: Path) -> str:
+        # The hasher reads the page cache directly instead of copies of it,
+        # and the kernel is told to read ahead for a sequential scan
+        with open(file_path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                hasher = _new_hasher()
+                hasher.update(mapped)
+                return hasher.hexdigest()
+
+    def _hash_whole_file(file_path: Path, file_size: int) -> str:
+        if file_size > MMAP_THRESHOLD:
+            return _hash_mapped(file_path)
+        return _hash_read(file_path)
+
+def _chunk_buffer() -> memoryview:
+    """This thread's ``CHUNK_SIZE`` read buffer."""
+    buffer = getattr(_buffers, 'chunk', None)
+    if buffer is None:
+        buffer = _buffers.chunk = memoryview(bytearray(CHUNK_SIZE))
+    return buffer
+
 def get_file_hash(file_path: Path, fast_check: bool = False) -> Optional[str]:
     """Calculate the hash of a file's content.
     
@@ -30,33 +108,53 @@ def get_file_hash(file_path: Path, fast_check: bool = False) -> Optional[str]:
         
         # For empty files, return a constant hash
         if file_size == 0:
-            return hashlib.md5().hexdigest()
+            return _new_hasher().hexdigest()
             
         # For small files, just hash the whole thing
         if file_size <= 2 * CHUNK_SIZE or not fast_check:
-            hasher = hashlib.md5()
-            with open(file_path, 'rb') as f:
-                while chunk := f.read(CHUNK_SIZE):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
+            return _hash_whole_file(file_path, file_size)
         
         # For large files, hash the first and last chunks to speed things up
-        hasher = hashlib.md5()
+        hasher = _new_hasher()
+        buffer = _chunk_buffer()
         with open(file_path, 'rb') as f:
             # Hash the first chunk
-            hasher.update(f.read(CHUNK_SIZE))
+            hasher.update(buffer[:f.readinto(buffer)])
             
             # If the file is larger than 2 chunks, seek to near the end and hash the last chunk
             if file_size > 2 * CHUNK_SIZE:
                 f.seek(-CHUNK_SIZE, 2)  # Seek to CHUNK_SIZE bytes from the end
-                hasher.update(f.read())
+                hasher.update(buffer[:f.readinto(buffer)])
                 
         return hasher.hexdigest()
         
-    except (IOError, OSError) as e:
+    except (OSError, ValueError) as e:
+        # ValueError: the file was emptied after its size was read, so it
+        # can't be memory mapped
         logger.debug("Error hashing file %s: %s", file_path, e)
         return None
 
+def _head_digest(file_path: Path) -> Optional[bytes]:
+    """Digest of the first ``HEAD_SIZE`` bytes of a file, or None if it can't be read."""
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(HEAD_SIZE)
+    except OSError as e:
+        logger.debug("Error reading %s: %s", file_path, e)
+        return None
+    hasher = _new_hasher()
+    hasher.update(head)
+    return hasher.digest()
+
+def _file_identity(file_path: Path) -> Optional[Tuple[int, Tuple[int, int]]]:
+    """Size and ``(st_dev, st_ino)`` of a file, or None if it can't be read."""
+    try:
+        st = file_path.stat()
+    except OSError as e:
+        logger.debug("Error getting size for %s: %s", file_path, e)
+        return None
+    return st.st_size, (st.st_dev, st.st_ino)
+
 def find_duplicate_files(
     search_dir: str,
     min_size: int = 0,
@@ -64,7 +162,11 @@ def find_duplicate_files(
     file_pattern: str = "*",
     exclude_dirs: Optional[List[str]] = None,
     fast_mode: bool = True,
-    compare_content: bool = True
+    compare_content: bool = True,
+    file_sizes: Optional[Dict[str, int]] = None,
+    max_hash_bytes: Optional[int] = MAX_HASH_BYTES,
+    hardlinks: Optional[Dict[str, List[str]]] = None,
+    skipped: Optional[Dict[str, int]] = None
 ) -> Dict[str, List[str]]:
     """Find duplicate files in a directory.
     
@@ -76,6 +178,16 @@ def find_duplicate_files(
         exclude_dirs: List of directory patterns to exclude
         fast_mode: If True, use faster but less accurate hashing
         compare_content: If True, compare file contents for potential duplicates
+        file_sizes: If given, filled with the size of every returned path, as
+            measured during the scan
+        max_hash_bytes: Skip comparing the content of any group whose hashing
+            would take the bytes read past this total (None for no limit)
+        hardlinks: If given, filled with the other paths of every returned
+            path that has more than one; hard links to the same file are
+            never reported as duplicates of each other
+        skipped: If given, ``'groups'`` and ``'bytes'`` are set to the number
+            of candidate groups left uncompared because of ``max_hash_bytes``
+            and the bytes hashing them would have read
         
     Returns:
         Dict mapping file hashes to lists of duplicate file paths
@@ -86,23 +198,58 @@ def find_duplicate_files(
     # First, find all files and group them by size (files with same size could be duplicates)
     size_map = defaultdict(list)
     
-    for file_path in find_files(
+    files = list(find_file_stats(
         search_dir,
-        include=file_pattern,
-        exclude="|".join(exclude_dirs) if exclude_dirs else None,
+        include=compile_globs(file_pattern),
+        exclude=compile_globs(exclude_dirs),
         min_size=min_size,
         max_size=max_size,
         skip_binary=True
-    ):
-        try:
-            file_size = file_path.stat().st_size
-            size_map[file_size].append(file_path)
-        except OSError as e:
-            logger.debug("Error getting size for %s: %s", file_path, e)
+    ))
+    
+    # The walk's stat carries the inode everywhere but on Windows, where
+    # scandir leaves it 0; only those files are stat'ed again, in threads
+    restat = [file_path for file_path, st in files if not st.st_ino]
+    identities: Dict[Path, Optional[Tuple[int, Tuple[int, int]]]] = {}
+    if restat:
+        with ThreadPoolExecutor(max_workers=min(WALK_WORKERS, len(restat))) as pool:
+            identities = dict(zip(restat, pool.map(_file_identity, restat)))
+    
+    # Hard links share their content, so only the first path seen for each
+    # file is compared; the others are kept under it
+    inode_seen: Dict[Tuple[int, int], Path] = {}
+    links = defaultdict(list)
+    
+    for file_path, st in files:
+        if st.st_ino:
+            identity = st.st_size, (st.st_dev, st.st_ino)
+        else:
+            identity = identities[file_path]
+            if identity is None:
+                continue
+        file_size, inode = identity
+        # An inode number of 0 means the file system doesn't provide one
+        if inode[1]:
+            first = inode_seen.setdefault(inode, file_path)
+            if first is not file_path:
+                links[first].append(file_path)
+                continue
+        size_map[file_size].append(file_path)
     
     # For files with unique sizes, they can't have duplicates
     potential_duplicates = {size: paths for size, paths in size_map.items() if len(paths) > 1}
     
+    if file_sizes is not None:
+        for size, paths in potential_duplicates.items():
+            for path in paths:
+                file_sizes[str(path)] = size
+    
+    if hardlinks is not None:
+        for paths in potential_duplicates.values():
+            for path in paths:
+                if path in links:
+                    hardlinks[str(path)] = [str(p) for p in links[path]]
+    
     if not potential_duplicates or not compare_content:
         # If we're not comparing content, return files with the same size as potential duplicates
         return {
@@ -110,12 +257,34 @@ def find_duplicate_files(
             for size, paths in potential_duplicates.items()
         }
     
-    # Now, for files with the same size, compare their content hashes
+    # Files of the same size usually already differ in their first bytes, so
+    # split the groups on a digest of the head before reading files in full
+    head_map = defaultdict(list)
+    for size, file_paths in potential_duplicates.items():
+        for file_path in file_paths:
+            head = _head_digest(file_path)
+            if head is not None:
+                head_map[size, head].append(file_path)
+    
+    # Now, for files with the same size and head, compare their content hashes
     hash_map = defaultdict(list)
     
-    for size, file_paths in potential_duplicates.items():
+    bytes_hashed = 0
+    skipped_groups = skipped_bytes = 0
+    for (size, _), file_paths in head_map.items():
         if len(file_paths) < 2:
             continue
+        
+        # Groups are hashed whole or not at all, so every group returned is
+        # complete; a group that doesn't fit is skipped, but smaller ones
+        # after it are still compared
+        file_cost = 2 * CHUNK_SIZE if fast_mode and size > 2 * CHUNK_SIZE else size
+        group_cost = file_cost * len(file_paths)
+        if max_hash_bytes is not None and bytes_hashed + group_cost > max_hash_bytes:
+            skipped_groups += 1
+            skipped_bytes += group_cost
+            continue
+        bytes_hashed += group_cost
             
         # For each potential duplicate, calculate its hash
         for file_path in file_paths:
@@ -123,6 +292,16 @@ def find_duplicate_files(
             if file_hash is not None:
                 hash_map[file_hash].append(file_path)
     
+    if skipped_groups:
+        logger.warning(
+            "Skipped comparing %d group(s) of same-size files (%d bytes) "
+            "that would exceed max_hash_bytes (%d)",
+            skipped_groups, skipped_bytes, max_hash_bytes
+        )
+    if skipped is not None:
+        skipped['groups'] = skipped_groups
+        skipped['bytes'] = skipped_bytes
+    
     # Filter out hashes with only one file (no duplicates)
     return {
         hash_val: [str(p) for p in paths]
@@ -179,6 +358,13 @@ def find_duplicate_files(
             description="Compare file contents (slower but more accurate)",
             default=True
         ),
+        ToolParameter(
+            name="max_hash_bytes",
+            type=int,
+            description="Maximum number of bytes to read when comparing file contents",
+            default=MAX_HASH_BYTES,
+            min=0
+        ),
         ToolParameter(
             name="min_duplicate_group",
             type=int,
@@ -215,6 +401,7 @@ class DuplicateFileFinderTool(BaseTool):
         exclude_dirs: Optional[List[str]] = None,
         fast_mode: bool = True,
         compare_content: bool = True,
+        max_hash_bytes: Optional[int] = MAX_HASH_BYTES,
         min_duplicate_group: int = 2,
         max_results: int = 100,
         **kwargs
@@ -232,7 +419,10 @@ class DuplicateFileFinderTool(BaseTool):
         }
         
         try:
-            # Find all duplicate files
+            # Find all duplicate files, keeping the sizes measured by the scan
+            file_sizes = {}
+            hardlinks = {}
+            skipped = {}
             duplicates = find_duplicate_files(
                 search_dir=search_dir,
                 min_size=min_size,
@@ -240,13 +430,17 @@ class DuplicateFileFinderTool(BaseTool):
                 file_pattern=file_pattern,
                 exclude_dirs=exclude_dirs,
                 fast_mode=fast_mode,
-                compare_content=compare_content
+                compare_content=compare_content,
+                file_sizes=file_sizes,
+                max_hash_bytes=max_hash_bytes,
+                hardlinks=hardlinks,
+                skipped=skipped
             )
             
             # Sort by number of duplicates (descending) and limit results
             sorted_duplicates = sorted(
                 duplicates.items(),
-                key=lambda x: (len(x[1]), sum(os.path.getsize(f) for f in x[1] if os.path.exists(f))),
+                key=lambda x: (len(x[1]), sum(file_sizes[f] for f in x[1])),
                 reverse=True
             )
             
@@ -261,16 +455,16 @@ class DuplicateFileFinderTool(BaseTool):
                 total_size = 0
                 
                 for file_path in files:
-                    try:
-                        file_size = os.path.getsize(file_path)
-                        files_with_size.append({
-                            'path': file_path,
-                            'size': file_size,
-                            'size_human': f"{file_size / (1024 * 1024):.2f} MB"
-                        })
-                        total_size += file_size
-                    except OSError:
-                        continue
+                    file_size = file_sizes[file_path]
+                    file_info = {
+                        'path': file_path,
+                        'size': file_size,
+                        'size_human': f"{file_size / (1024 * 1024):.2f} MB"
+                    }
+                    if file_path in hardlinks:
+                        file_info['hardlinks'] = hardlinks[file_path]
+                    files_with_size.append(file_info)
+                    total_size += file_size
                 
                 if len(files_with_size) < min_duplicate_group:
                     continue
@@ -301,6 +495,9 @@ class DuplicateFileFinderTool(BaseTool):
             result['total_wasted_human'] = (
                 f"{result['total_wasted'] / (1024 * 1024):.2f} MB"
             )
+            # Candidate groups whose contents weren't compared under max_hash_bytes
+            result['skipped_groups'] = skipped.get('groups', 0)
+            result['skipped_bytes'] = skipped.get('bytes', 0)
             
         except Exception as e:
             logger.exception("Error finding duplicate files")
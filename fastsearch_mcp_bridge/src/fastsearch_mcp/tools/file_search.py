@@ -1,13 +1,20 @@
 """File content search tool for MCP."""
 import asyncio
 import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Pattern, Set, Union
 
 from fastsearch_mcp.tools.base import (
     BaseTool, ToolCategory, ToolParameter, tool
 )
-from fastsearch_mcp.utils.file_utils import find_files, search_in_file
+from fastsearch_mcp.logging_config import get_logger
+from fastsearch_mcp.utils.file_utils import WALK_WORKERS, compile_globs, find_files, search_in_file
+
+logger = get_logger(__name__)
 
 
 @tool(
@@ -114,28 +121,16 @@ class FileContentSearchTool(BaseTool):
                 "matches": []
             }
         
-        # Convert file pattern to regex for find_files
-        file_regex = (
-            file_pattern
-            .replace(".", "\\.")
-            .replace("*", ".*")
-            .replace("?", ".")
-            .replace(",", "|")
-            .replace("{", "(")
-            .replace("}", ")")
-        )
-        
-        # Convert exclude_dirs to regex pattern
-        exclude_pattern = "|\\.".join(
-            re.escape(d).replace("*", ".*").replace("?", ".") 
-            for d in exclude_dirs
-        )
+        # Compile the globs once; file names must match file_pattern and no
+        # directory on the way may match exclude_dirs
+        include_re = compile_globs(file_pattern)
+        exclude_re = compile_globs(exclude_dirs)
         
         # Find all matching files
         files = list(find_files(
             root_dir=search_path,
-            include=file_regex,
-            exclude=exclude_pattern,
+            include=include_re,
+            exclude=exclude_re,
             max_size=max_file_size_mb * 1024 * 1024,
             skip_binary=skip_binary
         ))
@@ -147,50 +142,80 @@ class FileContentSearchTool(BaseTool):
                 "matches": []
             }
         
-        # Search in each file
+        # Search the files in parallel threads: reading them releases the GIL,
+        # and literal patterns are mostly ruled out by a C-level byte search.
+        # Results are still collected in file order, so only a window of
+        # files ahead of the one being collected is in flight at a time.
         results = []
         total_matches = 0
         files_searched = 0
+        stop = threading.Event()
+        
+        def search_file(file_path: Path) -> Optional[List[Dict[str, Any]]]:
+            # Matches still wanted when the search starts; earlier files may
+            # use some of them, so this is only an upper bound
+            remaining = max_results - total_matches
+            if stop.is_set() or remaining <= 0:
+                return None
+            return search_in_file(
+                file_path=file_path,
+                pattern=search_pattern,
+                case_sensitive=case_sensitive,
+                whole_word=whole_word,
+                context_lines=context_lines,
+                max_matches=remaining
+            )
         
-        for file_path in files:
-            if total_matches >= max_results:
-                break
-                
+        workers = min(WALK_WORKERS, len(files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = iter(files)
+            in_flight = deque(
+                (file_path, pool.submit(search_file, file_path))
+                for file_path in islice(pending, 2 * workers)
+            )
             try:
-                matches = search_in_file(
-                    file_path=file_path,
-                    pattern=search_pattern,
-                    case_sensitive=case_sensitive,
-                    whole_word=whole_word,
-                    context_lines=context_lines,
-                    max_matches=max_results - total_matches
-                )
-                
-                if matches:
-                    rel_path = file_path.relative_to(search_path)
-                    results.append({
-                        "file": str(rel_path),
-                        "path": str(file_path),
-                        "matches": [{
-                            "line": m["line"],
-                            "start": m["start"],
-                            "end": m["end"],
-                            "match": m["match"],
-                            "line_content": m["line_content"],
-                            "context": m["context"]
-                        } for m in matches]
-                    })
-                    total_matches += len(matches)
+                while in_flight and total_matches < max_results:
+                    file_path, future = in_flight.popleft()
+                    for next_path in islice(pending, 1):
+                        in_flight.append((next_path, pool.submit(search_file, next_path)))
+                        
+                    try:
+                        matches = future.result()
+                        
+                        if matches:
+                            matches = matches[:max_results - total_matches]
+                            rel_path = file_path.relative_to(search_path)
+                            results.append({
+                                "file": str(rel_path),
+                                "path": str(file_path),
+                                "matches": [{
+                                    "line": m["line"],
+                                    "start": m["start"],
+                                    "end": m["end"],
+                                    "match": m["match"],
+                                    "line_content": m["line_content"],
+                                    "context": m["context"]
+                                } for m in matches]
+                            })
+                            total_matches += len(matches)
+                            
+                    except Exception as e:
+                        logger.warning("Error searching in %s: %s", file_path, e)
+                        continue
+                        
+                    files_searched += 1
                     
-            except Exception as e:
-                print(f"Error searching in {file_path}: {e}")
-                continue
-                
-            files_searched += 1
-            
-            # Update progress periodically
-            if files_searched % 100 == 0:
-                print(f"Searched {files_searched}/{len(files)} files, found {total_matches} matches...")
+                    # Update progress periodically
+                    if files_searched % 100 == 0:
+                        logger.debug(
+                            "Searched %d/%d files, found %d matches",
+                            files_searched, len(files), total_matches
+                        )
+            finally:
+                # Skip the files that are no longer needed
+                stop.set()
+                for _, future in in_flight:
+                    future.cancel()
         
         return {
             "status": "completed",
@@ -0,0 +1,87 @@
+"""Batched directory listing for Windows.
+
+``os.scandir`` lists a directory with ``FindFirstFileW``/``FindNextFileW``,
+which fetch entries from the file system in small batches. This module calls
+``FindFirstFileExW`` with ``FIND_FIRST_EX_LARGE_FETCH`` instead, so each
+underlying query returns a large buffer of entries, and ``FindExInfoBasic`` so
+the short (8.3) names aren't looked up. Only importable on Windows.
+"""
+import ctypes
+import os
+from ctypes import wintypes
+from typing import Iterator, Tuple
+
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+_FIND_EX_INFO_BASIC = 1
+_FIND_EX_SEARCH_NAME_MATCH = 0
+_FIND_FIRST_EX_LARGE_FETCH = 2
+
+_ERROR_FILE_NOT_FOUND = 2
+_ERROR_NO_MORE_FILES = 18
+
+_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+_FindFirstFileExW = _kernel32.FindFirstFileExW
+_FindFirstFileExW.argtypes = (
+    wintypes.LPCWSTR,
+    ctypes.c_int,
+    ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+    ctypes.c_int,
+    ctypes.c_void_p,
+    wintypes.DWORD,
+)
+_FindFirstFileExW.restype = wintypes.HANDLE
+
+_FindNextFileW = _kernel32.FindNextFileW
+_FindNextFileW.argtypes = (wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW))
+_FindNextFileW.restype = wintypes.BOOL
+
+_FindClose = _kernel32.FindClose
+_FindClose.argtypes = (wintypes.HANDLE,)
+_FindClose.restype = wintypes.BOOL
+
+
+def scandir_basic(path: str) -> Iterator[Tuple[str, int, int, int]]:
+    """Yield ``(name, attributes, size, reparse_tag)`` for the entries of ``path``.
+
+    ``reparse_tag`` is 0 unless ``attributes`` has
+    ``FILE_ATTRIBUTE_REPARSE_POINT``. The ``.`` and ``..`` entries are skipped.
+
+    Raises:
+        OSError: If the directory can't be listed.
+    """
+    data = wintypes.WIN32_FIND_DATAW()
+    handle = _FindFirstFileExW(
+        os.path.join(path, '*'),
+        _FIND_EX_INFO_BASIC,
+        ctypes.byref(data),
+        _FIND_EX_SEARCH_NAME_MATCH,
+        None,
+        _FIND_FIRST_EX_LARGE_FETCH,
+    )
+    if handle == _INVALID_HANDLE_VALUE:
+        error = ctypes.get_last_error()
+        if error == _ERROR_FILE_NOT_FOUND:
+            # Nothing matched, which only happens for an empty drive root
+            return
+        raise ctypes.WinError(error)
+
+    try:
+        while True:
+            name = data.cFileName
+            if name != '.' and name != '..':
+                attributes = data.dwFileAttributes
+                reparse_tag = data.dwReserved0 if attributes & FILE_ATTRIBUTE_REPARSE_POINT else 0
+                yield name, attributes, (data.nFileSizeHigh << 32) | data.nFileSizeLow, reparse_tag
+
+            if not _FindNextFileW(handle, ctypes.byref(data)):
+                error = ctypes.get_last_error()
+                if error == _ERROR_NO_MORE_FILES:
+                    return
+                raise ctypes.WinError(error)
+    finally:
+        _FindClose(handle)
@@ -1,13 +1,31 @@
 """File system utilities for MCP tools."""
+import codecs
+import fnmatch
+import io
 import os
 import re
+import sys
 from pathlib import Path
-from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple, Union
 
 from fastsearch_mcp.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Threads for I/O-bound directory walks; scandir and stat release the GIL
+WALK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+if sys.platform == 'win32':
+    from fastsearch_mcp.utils import _win_scandir
+else:
+    _win_scandir = None
+
+# Characters that give a search pattern a regex meaning
+_REGEX_METACHARS = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+# A {a,b} alternation group in a glob
+_BRACE_RE = re.compile(r"\{([^{}]*)\}")
+
 # Common binary file extensions to skip by default
 BINARY_EXTENSIONS = {
     # Executables and libraries
@@ -71,7 +89,98 @@ def is_binary_file(file_path: Union[str, Path], check_content: bool = True) -> b
         logger.warning("Could not read file: %s", file_path)
         return True
 
-def find_files(
+def classify_entry(entry: os.DirEntry) -> str:
+    """Classify a directory entry as ``'file'``, ``'dir'`` or ``'skip'``.
+    
+    Symlinks and special files are skipped, as is anything with a reparse
+    point on Windows (junctions, mount points, cloud placeholders). Symlinks
+    are not followed, so the type usually comes from the directory listing
+    itself without a stat call.
+    """
+    try:
+        if (
+            _win_scandir is not None
+            and entry.stat(follow_symlinks=False).st_file_attributes
+            & _win_scandir.FILE_ATTRIBUTE_REPARSE_POINT
+        ):
+            return 'skip'
+        if entry.is_dir(follow_symlinks=False):
+            return 'dir'
+        if entry.is_file(follow_symlinks=False):
+            return 'file'
+    except OSError:
+        pass
+    return 'skip'
+
+def scan_sizes(path: str) -> Iterator[Tuple[str, str, int]]:
+    """Yield ``(path, kind, size)`` for the entries of a directory.
+    
+    ``kind`` is as returned by :func:`classify_entry` and ``size`` is only
+    meaningful for files. On Windows the listing is fetched in large batches
+    and already carries the sizes; elsewhere each file is stat'ed, and files
+    that can't be are left out.
+    
+    Raises:
+        OSError: If the directory can't be listed.
+    """
+    if _win_scandir is not None:
+        for name, attributes, size, _ in _win_scandir.scandir_basic(path):
+            if attributes & _win_scandir.FILE_ATTRIBUTE_REPARSE_POINT:
+                kind = 'skip'
+            elif attributes & _win_scandir.FILE_ATTRIBUTE_DIRECTORY:
+                kind = 'dir'
+            else:
+                kind = 'file'
+            yield os.path.join(path, name), kind, size
+        return
+    
+    with os.scandir(path) as entries:
+        for entry in entries:
+            kind = classify_entry(entry)
+            size = 0
+            if kind == 'file':
+                try:
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError as e:
+                    logger.debug("Error accessing %s: %s", entry.path, e)
+                    continue
+            yield entry.path, kind, size
+
+def expand_glob(pattern: str) -> List[str]:
+    """Expand ``{a,b}`` groups and comma-separated alternatives into plain globs."""
+    match = _BRACE_RE.search(pattern)
+    if match is None:
+        return [glob for glob in pattern.split(",") if glob]
+    head, tail = pattern[:match.start()], pattern[match.end():]
+    globs = []
+    for option in match.group(1).split(","):
+        globs.extend(expand_glob(head + option + tail))
+    return globs
+
+def compile_globs(patterns: Union[str, Iterable[str]]) -> Optional[Pattern]:
+    """Compile globs into one regex for the ``include``/``exclude`` of :func:`find_files`.
+    
+    Each pattern may hold ``{a,b}`` groups and comma-separated alternatives.
+    A glob matches a relative POSIX path from the start of any of its
+    components to the end; a leading ``**/`` is implied.
+    
+    Returns:
+        The compiled pattern, or None if there are no globs.
+    """
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    parts = []
+    for pattern in patterns:
+        for glob in expand_glob(pattern):
+            if glob.startswith("**/"):
+                glob = glob[3:]
+            # Each translation is complete, anchored at the end of the path
+            parts.append(fnmatch.translate(glob))
+    if not parts:
+        return None
+    return re.compile(r"(?:^|/)(?:%s)" % "|".join(dict.fromkeys(parts)))
+
+def find_file_stats(
     root_dir: Union[str, Path],
     include: Optional[Union[str, Pattern]] = None,
     exclude: Optional[Union[str, Pattern]] = None,
@@ -80,13 +189,19 @@ def find_files(
     max_size: Optional[int] = None,
     file_types: Optional[Set[str]] = None,
     skip_binary: bool = True,
-) -> Iterator[Path]:
-    """Find files matching the given criteria.
+) -> Iterator[Tuple[Path, os.stat_result]]:
+    """Find files matching the given criteria, with the stat of each.
+    
+    The stat is the one taken to check the size, without following symlinks,
+    so callers needn't stat again; on Windows its ``st_ino`` and ``st_dev``
+    are 0.
     
     Args:
         root_dir: Directory to search in
-        include: Regex pattern to include files
-        exclude: Regex pattern to exclude files
+        include: Regex pattern to include files, searched in their path
+            relative to ``root_dir`` (see :func:`compile_globs`)
+        exclude: Regex pattern to exclude files, searched in their relative
+            path; directories whose relative path matches are not entered
         max_depth: Maximum depth to search
         min_size: Minimum file size in bytes
         max_size: Maximum file size in bytes
@@ -94,7 +209,7 @@ def find_files(
         skip_binary: Whether to skip binary files
         
     Yields:
-        Path: Path to matching files
+        Tuple[Path, os.stat_result]: Path to matching files and their stat
     """
     root_path = Path(root_dir).resolve()
     
@@ -108,52 +223,114 @@ def find_files(
     else:
         exclude_re = exclude
     
-    for root, dirs, files in os.walk(root_path):
-        # Apply max depth
-        if max_depth is not None:
-            depth = Path(root).relative_to(root_path).as_posix().count('/') + 1
-            if depth > max_depth:
-                continue
+    # Depth counts the root and its immediate subdirectories as 1
+    if max_depth is not None and max_depth < 1:
+        return
+    
+    # (directory, its path relative to the root with a trailing '/', depth),
+    # visited depth-first in the order os.walk would
+    pending = [(str(root_path), '', 0)]
+    while pending:
+        directory, rel_dir, depth = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
         
-        for filename in files:
-            file_path = Path(root) / filename
-            
-            # Skip broken symlinks
-            if not file_path.exists():
+        subdirs = []
+        for entry in entries:
+            kind = classify_entry(entry)
+            if kind == 'dir':
+                if max_depth is None or depth + 1 <= max_depth:
+                    rel_subdir = rel_dir + entry.name
+                    if exclude_re and exclude_re.search(rel_subdir):
+                        continue
+                    subdirs.append((entry.path, rel_subdir + '/', depth + 1))
                 continue
-                
-            # Skip directories (shouldn't happen with os.walk, but just in case)
-            if file_path.is_dir():
+            if kind != 'file':
                 continue
-                
-            # Skip binary files if requested
-            if skip_binary and is_binary_file(file_path):
-                continue
-                
-            # Apply include/exclude patterns
-            rel_path = file_path.relative_to(root_path).as_posix()
+            
+            # Cheap checks on the name first; the binary check reads the file
+            rel_path = rel_dir + entry.name
             if include_re and not include_re.search(rel_path):
                 continue
             if exclude_re and exclude_re.search(rel_path):
                 continue
                 
-            # Check file size
-            try:
-                size = file_path.stat().st_size
-                if size < min_size:
-                    continue
-                if max_size is not None and size > max_size:
-                    continue
-            except OSError:
-                continue
-                
             # Check file extension
             if file_types:
-                ext = file_path.suffix.lower()
+                ext = os.path.splitext(entry.name)[1].lower()
                 if ext not in file_types:
                     continue
                     
-            yield file_path
+            # Check file size
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            size = st.st_size
+            if size < min_size:
+                continue
+            if max_size is not None and size > max_size:
+                continue
+                
+            file_path = Path(entry.path)
+            
+            # Skip binary files if requested
+            if skip_binary and is_binary_file(file_path):
+                continue
+                
+            yield file_path, st
+        
+        pending.extend(reversed(subdirs))
+
+def find_files(
+    root_dir: Union[str, Path],
+    include: Optional[Union[str, Pattern]] = None,
+    exclude: Optional[Union[str, Pattern]] = None,
+    max_depth: Optional[int] = None,
+    min_size: int = 0,
+    max_size: Optional[int] = None,
+    file_types: Optional[Set[str]] = None,
+    skip_binary: bool = True,
+) -> Iterator[Path]:
+    """Find files matching the given criteria.
+    
+    Args:
+        root_dir: Directory to search in
+        include: Regex pattern to include files, searched in their path
+            relative to ``root_dir`` (see :func:`compile_globs`)
+        exclude: Regex pattern to exclude files, searched in their relative
+            path; directories whose relative path matches are not entered
+        max_depth: Maximum depth to search
+        min_size: Minimum file size in bytes
+        max_size: Maximum file size in bytes
+        file_types: Set of file extensions to include (with leading .)
+        skip_binary: Whether to skip binary files
+        
+    Yields:
+        Path: Path to matching files
+    """
+    for file_path, _ in find_file_stats(
+        root_dir, include, exclude, max_depth, min_size, max_size, file_types, skip_binary
+    ):
+        yield file_path
+
+def _may_contain(data: bytes, text: str, case_sensitive: bool) -> bool:
+    """Whether UTF-8 ``data`` could contain the literal ``text``.
+    
+    Checks the raw bytes with a substring search, which is much cheaper than
+    decoding them and running a regex over every line. Only answers False
+    when the text certainly isn't there.
+    """
+    needle = text.encode('utf-8')
+    if case_sensitive:
+        return needle in data
+    # Without non-ASCII characters, ASCII case folding is the same as re.IGNORECASE
+    if data.isascii() and needle.isascii():
+        return needle.lower() in data.lower()
+    return True
 
 def search_in_file(
     file_path: Union[str, Path],
@@ -182,6 +359,28 @@ def search_in_file(
     """
     if not os.path.isfile(file_path):
         return []
+    
+    # Literal patterns rule out non-matching files from the raw bytes first;
+    # files that pass are decoded from the same bytes rather than read again.
+    # Text with line breaks or replacement characters can match decoded lines
+    # without matching the bytes, so it takes the regular path.
+    data = None
+    if (
+        isinstance(pattern, str)
+        and pattern
+        and (whole_word or not _REGEX_METACHARS.search(pattern))
+        and not any(c in pattern for c in '\r\n\ufffd')
+        and codecs.lookup(encoding).name == 'utf-8'
+    ):
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            # Let the regular read below report the error
+            pass
+        else:
+            if not _may_contain(data, pattern, case_sensitive):
+                return []
         
     # Compile the pattern
     if isinstance(pattern, str):
@@ -197,8 +396,12 @@ def search_in_file(
     matches = []
     
     try:
-        with open(file_path, 'r', encoding=encoding, errors=errors) as f:
-            lines = f.readlines()
+        if data is not None:
+            # Same newline handling as reading the file in text mode
+            lines = io.TextIOWrapper(io.BytesIO(data), encoding=encoding, errors=errors).readlines()
+        else:
+            with open(file_path, 'r', encoding=encoding, errors=errors) as f:
+                lines = f.readlines()
             
         for i, line in enumerate(lines, 1):
             line_matches = list(pattern.finditer(line))
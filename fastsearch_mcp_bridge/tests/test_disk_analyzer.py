@@ -0,0 +1,68 @@
+"""Tests for the disk space analyzer."""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the source directory to the path so we can import the package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from fastsearch_mcp.tools.disk_analyzer import get_disk_usage
+
+# Relative path -> size of every file in the test tree
+FILES = {
+    "a.bin": 100,
+    "one/b.bin": 200,
+    "one/two/c.bin": 300,
+    "one/two/three/d.bin": 400,
+}
+
+def _depth(usage) -> int:
+    """Depth of the deepest entry in a usage tree, the root being 0."""
+    return 1 + max((_depth(child) for child in usage.children), default=-1)
+
+class TestGetDiskUsage(unittest.TestCase):
+    """Test get_disk_usage."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = str(Path(self._tmp.name).resolve())
+        for rel_path, size in FILES.items():
+            path = os.path.join(self.root, *rel_path.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b"x" * size)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def assertTotals(self, usage):
+        self.assertEqual(usage.size, sum(FILES.values()))
+        self.assertEqual(usage.file_count, len(FILES))
+        self.assertEqual(usage.dir_count, 3)
+
+    def test_max_depth_limits_children_only(self):
+        """Totals cover the whole tree; children stop at max_depth."""
+        usage = get_disk_usage(self.root, max_depth=1)
+
+        self.assertTotals(usage)
+        self.assertEqual(_depth(usage), 1)
+        child = usage.children[0]
+        self.assertEqual(child.size, 900)
+        self.assertEqual(child.dir_count, 2)
+        self.assertEqual(child.children, [])
+
+    def test_max_depth_zero_is_unlimited(self):
+        """max_depth=0 builds children for every directory."""
+        usage = get_disk_usage(self.root, max_depth=0)
+
+        self.assertTotals(usage)
+        self.assertEqual(_depth(usage), 3)
+        deepest = usage.children[0].children[0].children[0]
+        self.assertEqual(Path(deepest.path).name, "three")
+        self.assertEqual(deepest.size, 400)
+        self.assertEqual(deepest.file_count, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Tests for the duplicate file finder."""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the source directory to the path so we can import the package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from fastsearch_mcp.tools.duplicate_finder import find_duplicate_files
+
+CONTENT = "duplicate content\n" * 100
+
+class TestHardLinks(unittest.TestCase):
+    """Test that hard links are collapsed before comparing content."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = str(Path(self._tmp.name).resolve())
+        self.original = self.write("original.txt")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write(self, name: str, content: str = CONTENT) -> str:
+        path = os.path.join(self.root, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def link(self, name: str) -> str:
+        path = os.path.join(self.root, name)
+        try:
+            os.link(self.original, path)
+        except (OSError, NotImplementedError) as e:
+            self.skipTest(f"Hard links are not available: {e}")
+        return path
+
+    def test_hard_links_are_not_duplicates(self):
+        """Links to one file are not reported as duplicates of each other."""
+        self.link("link1.txt")
+        self.link("link2.txt")
+
+        hardlinks = {}
+        self.assertEqual(find_duplicate_files(self.root, hardlinks=hardlinks), {})
+        self.assertEqual(hardlinks, {})
+
+    def test_links_are_reported_under_their_representative(self):
+        """A copy is a duplicate; the other links are listed under the linked path."""
+        links = {self.link("link1.txt"), self.link("link2.txt")}
+        copy = self.write("copy.txt")
+
+        hardlinks = {}
+        duplicates = find_duplicate_files(self.root, hardlinks=hardlinks)
+
+        self.assertEqual(len(duplicates), 1)
+        group = next(iter(duplicates.values()))
+        self.assertEqual(len(group), 2)
+        self.assertIn(copy, group)
+        representative = next(path for path in group if path != copy)
+        self.assertEqual(list(hardlinks), [representative])
+        self.assertEqual(
+            set(hardlinks[representative]),
+            (links | {self.original}) - {representative}
+        )
+
+    def test_different_content_is_not_duplicate(self):
+        """Same-size files with different content aren't grouped."""
+        self.link("link.txt")
+        self.write("other.txt", CONTENT.replace("d", "D"))
+
+        self.assertEqual(find_duplicate_files(self.root), {})
+
+if __name__ == "__main__":
+    unittest.main()
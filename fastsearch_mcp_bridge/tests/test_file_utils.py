@@ -0,0 +1,139 @@
+"""Tests for the file system utilities."""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the source directory to the path so we can import the package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from fastsearch_mcp.utils.file_utils import classify_entry, compile_globs, find_file_stats, find_files
+
+def _write(path: str, content: str = "text\n") -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+def _symlink(test: unittest.TestCase, target: str, link: str, target_is_directory: bool = False) -> None:
+    try:
+        os.symlink(target, link, target_is_directory=target_is_directory)
+    except (OSError, NotImplementedError) as e:
+        test.skipTest(f"Symlinks are not available: {e}")
+
+class TestClassifyEntry(unittest.TestCase):
+    """Test classify_entry."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        _write(os.path.join(self.root, "file.txt"))
+        os.mkdir(os.path.join(self.root, "dir"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def classify(self):
+        with os.scandir(self.root) as entries:
+            return {entry.name: classify_entry(entry) for entry in entries}
+
+    def test_files_and_directories(self):
+        """Regular files and directories are classified by type."""
+        self.assertEqual(self.classify(), {"file.txt": "file", "dir": "dir"})
+
+    def test_symlinks_are_skipped(self):
+        """Symlinks to files and directories are skipped, not followed."""
+        _symlink(self, os.path.join(self.root, "file.txt"), os.path.join(self.root, "file_link"))
+        _symlink(self, os.path.join(self.root, "dir"), os.path.join(self.root, "dir_link"), True)
+
+        kinds = self.classify()
+
+        self.assertEqual(kinds["file_link"], "skip")
+        self.assertEqual(kinds["dir_link"], "skip")
+
+    def test_broken_symlink_is_skipped(self):
+        """A symlink whose target is gone is skipped without an error."""
+        _symlink(self, os.path.join(self.root, "missing"), os.path.join(self.root, "broken"))
+
+        self.assertEqual(self.classify()["broken"], "skip")
+
+class TestFindFiles(unittest.TestCase):
+    """Test find_files."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = str(Path(self._tmp.name).resolve())
+        for rel_path in (
+            "a.txt", "sub/b.txt", "sub/deep/c.txt", "sub/deep/deeper/f.txt",
+            "skip/d.txt", "skip/inner/e.txt",
+        ):
+            _write(os.path.join(self.root, *rel_path.split("/")))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def find(self, **kwargs):
+        return [
+            path.relative_to(self.root).as_posix()
+            for path in find_files(self.root, skip_binary=False, **kwargs)
+        ]
+
+    def test_order_matches_os_walk(self):
+        """Files come out in the order a top-down os.walk visits them."""
+        expected = [
+            Path(dirpath, name).relative_to(self.root).as_posix()
+            for dirpath, _, filenames in os.walk(self.root)
+            for name in filenames
+        ]
+
+        self.assertEqual(self.find(), expected)
+
+    def test_max_depth(self):
+        """The root and its subdirectories are depth 1; deeper ones are pruned."""
+        self.assertEqual(self.find(max_depth=0), [])
+        self.assertEqual(
+            sorted(self.find(max_depth=1)),
+            ["a.txt", "skip/d.txt", "sub/b.txt"]
+        )
+        self.assertNotIn("sub/deep/deeper/f.txt", self.find(max_depth=2))
+        self.assertEqual(len(self.find(max_depth=3)), 6)
+
+    def test_exclude_prunes_directories(self):
+        """A directory matching exclude is not entered at all."""
+        found = self.find(exclude=compile_globs(["**/skip"]))
+
+        self.assertEqual(
+            sorted(found),
+            ["a.txt", "sub/b.txt", "sub/deep/c.txt", "sub/deep/deeper/f.txt"]
+        )
+
+    def test_include_matches_relative_path(self):
+        """include globs match from the start of any path component."""
+        self.assertEqual(self.find(include=compile_globs("deep/c.txt")), ["sub/deep/c.txt"])
+        self.assertEqual(
+            sorted(self.find(include=compile_globs("{a,d}.txt"))),
+            ["a.txt", "skip/d.txt"]
+        )
+
+    def test_symlinked_directory_is_not_followed(self):
+        """Files are only found once, through their real directory."""
+        _symlink(self, os.path.join(self.root, "sub"), os.path.join(self.root, "link"), True)
+
+        self.assertFalse(any(path.startswith("link/") for path in self.find()))
+
+    def test_find_file_stats_yields_the_walk_stat(self):
+        """Each file comes with its lstat, in the same order as find_files."""
+        found = list(find_file_stats(self.root, skip_binary=False))
+
+        self.assertEqual(
+            [path.relative_to(self.root).as_posix() for path, _ in found],
+            self.find()
+        )
+        for path, st in found:
+            expected = os.lstat(path)
+            self.assertEqual(st.st_size, expected.st_size)
+            if st.st_ino:
+                self.assertEqual((st.st_dev, st.st_ino), (expected.st_dev, expected.st_ino))
+
+if __name__ == "__main__":
+    unittest.main()